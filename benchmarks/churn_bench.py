@@ -0,0 +1,106 @@
+"""
+How many unique IDs get a different device when a catalog grows.
+
+For every catalog, an older version of it is simulated by removing some of its device
+models or system versions, then unique IDs are mapped with both versions of the catalog:
+    modulo  - the default mapping, `deviceList[hash_id % len(deviceList)]`
+    stable  - consistent hashing, `RandomDevice(unique_id, stable=True)`
+
+The ideal churn is the share of devices that are new, `1 - old / new`. Run from the
+repository root:
+
+    python -m benchmarks.churn_bench --ids 50000 --added 5
+"""
+import argparse
+import random
+import sys
+
+from src.devices import (
+    DeviceSpace,
+    ProductSequence,
+    SystemInfo,
+    WindowsDevice,
+    LinuxDevice,
+    macOSDevice,
+    AndroidDevice,
+    iOSDeivce,
+    _versionFirst,
+)
+
+
+def without(space: DeviceSpace, models=(), versions=()) -> DeviceSpace:
+    """
+    The catalog as it was before `models` and `versions` were added to it.
+    """
+    segments = []
+    for segment in space.segments:
+        axis = 1 if segment.build is _versionFirst else 0
+        removed = [models, versions] if axis == 0 else [versions, models]
+
+        dimensions = [
+            [value for value in dimension if value not in removed[index]]
+            for index, dimension in enumerate(segment.dimensions)
+        ]
+        if all(len(dimension) != 0 for dimension in dimensions):
+            segments.append(ProductSequence(dimensions, segment.build))
+
+    return DeviceSpace(segments)
+
+
+def dimensionValues(space: DeviceSpace, model: bool):
+    values = []
+    for segment in space.segments:
+        axis = 1 if segment.build is _versionFirst else 0
+        for value in segment.dimensions[axis if model else 1 - axis]:
+            if value not in values:
+                values.append(value)
+    return values
+
+
+def churn(old: DeviceSpace, new: DeviceSpace, hash_ids, seeds):
+    modulo = sum(
+        str(old[hash_id % len(old)]) != str(new[hash_id % len(new)]) for hash_id in hash_ids
+    )
+    stable = sum(
+        str(old.stable(seed["model"], seed["system_version"]))
+        != str(new.stable(seed["model"], seed["system_version"]))
+        for seed in seeds
+    )
+    return modulo / len(hash_ids), stable / len(seeds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ids", type=int, default=20_000, help="unique IDs to map")
+    parser.add_argument("--added", type=int, default=3, help="models or versions added")
+    parser.add_argument("--seed", type=int, default=1, help="which entries are added")
+    args = parser.parse_args()
+
+    unique_ids = [f"churn{x}" for x in range(args.ids)]
+    hash_ids = SystemInfo._strtohashids(unique_ids)
+    seeds = SystemInfo._seedsMany(unique_ids)
+    chooser = random.Random(args.seed)
+
+    print(f"{'catalog':<16}{'added':<16}{'devices':>16}{'ideal':>10}{'modulo':>10}{'stable':>10}")
+
+    for system in [WindowsDevice, LinuxDevice, macOSDevice, AndroidDevice, iOSDeivce]:
+        system.__gen__()
+        new = DeviceSpace(system.deviceList.segments)  # type: ignore
+
+        for model in [True, False]:
+            values = dimensionValues(new, model)
+            added = chooser.sample(values, min(args.added, len(values) - 1))
+            old = without(new, *([added, ()] if model else [(), added]))
+
+            modulo, stable = churn(old, new, hash_ids, seeds)
+            print(
+                f"{system.__name__:<16}{f'{len(added)} ' + ('models' if model else 'versions'):<16}"
+                f"{f'{len(old)} -> {len(new)}':>16}{1 - len(old) / len(new):>10.2%}"
+                f"{modulo:>10.2%}{stable:>10.2%}"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
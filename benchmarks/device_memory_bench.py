@@ -0,0 +1,76 @@
+"""
+Memory footprint of each device catalog, measured with tracemalloc.
+
+Three layouts are compared for every platform:
+    legacy  - a list of DeviceInfo objects with a per-instance __dict__,
+              which is what __gen__ used to build
+    eager   - a list of the current, slotted DeviceInfo objects
+    lazy    - the DeviceSpace that __gen__ builds now
+
+Run from the repository root:
+
+    python -m benchmarks.device_memory_bench
+"""
+import sys
+import tracemalloc
+
+from src.devices import (
+    DeviceInfo,
+    WindowsDevice,
+    LinuxDevice,
+    macOSDevice,
+    AndroidDevice,
+    iOSDeivce,
+)
+
+
+class LegacyDeviceInfo(object):
+    def __init__(self, model, version) -> None:
+        self.model = model
+        self.version = version
+
+
+def traced(func):
+    tracemalloc.start()
+    result = func()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, peak
+
+
+def rebuild(system):
+    system.deviceList = []
+    if system is LinuxDevice:
+        system.system_versions = []
+    system.__gen__()
+    return system.deviceList
+
+
+def main() -> int:
+    systems = [WindowsDevice, LinuxDevice, macOSDevice, AndroidDevice, iOSDeivce]
+
+    print(
+        f"{'catalog':<16}{'devices':>10}{'legacy':>14}{'eager':>14}{'lazy':>14}"
+        f"{'lazy peak':>14}"
+    )
+
+    for system in systems:
+        system.__gen__()
+        devices = system.deviceList
+
+        _, lazy, lazy_peak = traced(lambda: rebuild(system))
+        _, legacy, _ = traced(
+            lambda: [LegacyDeviceInfo(x.model, x.version) for x in devices]
+        )
+        _, eager, _ = traced(lambda: [DeviceInfo(x.model, x.version) for x in devices])
+
+        print(
+            f"{system.__name__:<16}{len(devices):>10}{legacy / 1024:>11.1f} KB"
+            f"{eager / 1024:>11.1f} KB{lazy / 1024:>11.1f} KB{lazy_peak / 1024:>11.1f} KB"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
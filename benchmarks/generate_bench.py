@@ -0,0 +1,248 @@
+"""
+Cold-start and warm-path cost of `Generate()` for every preset.
+
+Every case runs in a fresh interpreter, so import time and the first call
+include building the device catalogs. For each preset and OS it measures:
+    import      time to import opentele
+    first call  latency of the first `Generate(unique_id=...)`
+    steady      median and p99 latency of `Generate()` once warmed up
+    bulk        throughput of `GenerateMany()`
+    memory      peak traced allocation of the bulk run and max RSS of the process
+
+Results are written as JSON so releases can be compared. Run from the
+repository root:
+
+    python -m benchmarks.generate_bench --output results.json
+    python -m benchmarks.generate_bench --compare results.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+CASES = [
+    ("TelegramDesktop", "windows"),
+    ("TelegramDesktop", "macos"),
+    ("TelegramDesktop", "linux"),
+    ("TelegramAndroid", None),
+    ("TelegramAndroidX", None),
+    ("TelegramIOS", None),
+    ("TelegramMacOS", None),
+]
+
+# metrics where a higher value is better, everything else is a cost
+HIGHER_IS_BETTER = {"bulk_per_second"}
+
+
+def caseName(preset: str, system: str = None) -> str:
+    return preset if system == None else f"{preset}/{system}"
+
+
+def maxRSS() -> int:
+    """
+    Max resident set size of this process in KB, or `None` where it can't be read.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def runCase(preset: str, system: str, iterations: int, bulk: int) -> dict:
+    """
+    Measure a single case, must be called in a fresh interpreter.
+    """
+    begin = time.perf_counter()
+    from src.api import API
+
+    import_time = time.perf_counter() - begin
+
+    cls = getattr(API, preset)
+    kwargs = {} if system == None else {"system": system}
+
+    begin = time.perf_counter()
+    cls.Generate(unique_id="first-call", **kwargs).destroy()
+    first_call = time.perf_counter() - begin
+
+    latencies = []
+    for index in range(iterations):
+        unique_id = f"steady-{index}"
+        begin = time.perf_counter()
+        api = cls.Generate(unique_id=unique_id, **kwargs)
+        latencies.append(time.perf_counter() - begin)
+        api.destroy()
+
+    latencies.sort()
+    unique_ids = [f"bulk-{index}" for index in range(bulk)]
+
+    begin = time.perf_counter()
+    apis = cls.GenerateMany(unique_ids, **kwargs)
+    bulk_time = time.perf_counter() - begin
+    for api in apis:
+        api.destroy()
+    del apis
+
+    # traced separately, tracemalloc slows down every allocation
+    import tracemalloc
+
+    tracemalloc.start()
+    apis = cls.GenerateMany(unique_ids, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for api in apis:
+        api.destroy()
+
+    return {
+        "case": caseName(preset, system),
+        "import_ms": import_time * 1e3,
+        "first_call_ms": first_call * 1e3,
+        "steady_median_us": statistics.median(latencies) * 1e6,
+        "steady_p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+        "bulk_per_second": bulk / bulk_time,
+        "bulk_peak_kb": peak / 1024,
+        "max_rss_kb": maxRSS(),
+    }
+
+
+def spawnCase(preset: str, system: str, iterations: int, bulk: int) -> dict:
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.generate_bench",
+        "--child",
+        preset,
+        system or "",
+        "--iterations",
+        str(iterations),
+        "--bulk",
+        str(bulk),
+    ]
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE).stdout
+    return json.loads(output)
+
+
+def gitRevision() -> str:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode().strip()
+
+
+def median(runs: list) -> dict:
+    """
+    The median of every metric over repeated runs of a case.
+    """
+    result = {"case": runs[0]["case"]}
+    for key, value in runs[0].items():
+        if key != "case" and value != None:
+            result[key] = statistics.median(run[key] for run in runs)
+    return result
+
+
+def compare(old: dict, new: dict) -> None:
+    previous = {result["case"]: result for result in old["results"]}
+
+    print(f"\ncompared to {old['meta'].get('revision')} ({old['meta'].get('date')}):")
+    for result in new["results"]:
+        base = previous.get(result["case"])
+        if base == None:
+            continue
+
+        changes = []
+        for key, value in result.items():
+            if key == "case" or not base.get(key):
+                continue
+            ratio = value / base[key]
+            if key not in HIGHER_IS_BETTER:
+                ratio = 1 / ratio if ratio else float("inf")
+            changes.append(f"{key} x{ratio:.2f}")
+
+        print(f"  {result['case']:<26}" + "  ".join(changes))
+    print("  (x > 1 is an improvement)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10_000, help="steady-state calls")
+    parser.add_argument("--bulk", type=int, default=100_000, help="GenerateMany() size")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per case")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against a previous JSON result")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        preset, system = args.child
+        result = runCase(preset, system or None, args.iterations, args.bulk)
+        print(json.dumps(result))
+        return 0
+
+    print(
+        f"{'case':<26}{'import':>10}{'first':>10}{'median':>10}{'p99':>10}"
+        f"{'bulk/s':>12}{'peak':>12}{'rss':>12}"
+    )
+
+    results = []
+    for preset, system in CASES:
+        runs = [
+            spawnCase(preset, system, args.iterations, args.bulk)
+            for _ in range(args.repeat)
+        ]
+        result = median(runs)
+        results.append(result)
+
+        print(
+            f"{result['case']:<26}{result['import_ms']:>7.1f} ms"
+            f"{result['first_call_ms']:>7.1f} ms{result['steady_median_us']:>7.1f} us"
+            f"{result['steady_p99_us']:>7.1f} us{result['bulk_per_second']:>12.0f}"
+            f"{result['bulk_peak_kb'] / 1024:>9.1f} MB"
+            + (
+                f"{result['max_rss_kb'] / 1024:>9.1f} MB"
+                if "max_rss_kb" in result
+                else f"{'-':>12}"
+            )
+        )
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": gitRevision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "iterations": args.iterations,
+            "bulk": args.bulk,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"\nwrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(json.load(file), report)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
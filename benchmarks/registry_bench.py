@@ -0,0 +1,64 @@
+"""
+Registration cost of `APIData` instances as the registry grows.
+
+Every `APIData()` draws a fresh pid, checks it against the registry and then
+registers itself, so the total cost of creating N instances has to stay linear
+in N. Run from the repository root:
+
+    python -m benchmarks.registry_bench --max 1000000
+"""
+import argparse
+import sys
+import time
+
+from src.api import API, APIData
+
+
+def measure(count: int) -> float:
+    keep = []
+    begin = time.perf_counter()
+    for _ in range(count):
+        keep.append(API.TelegramAndroid())
+    elapsed = time.perf_counter() - begin
+
+    for api in keep:
+        api.destroy()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max", type=int, default=1_000_000, help="largest fleet size")
+    parser.add_argument("--min", type=int, default=1_000, help="smallest fleet size")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=3.0,
+        help="max allowed growth of the per-instance cost between min and max",
+    )
+    args = parser.parse_args()
+
+    sizes = []
+    size = args.min
+    while size < args.max:
+        sizes.append(size)
+        size *= 10
+    sizes.append(args.max)
+
+    per_instance = []
+    for size in sizes:
+        elapsed = measure(size)
+        per_instance.append(elapsed / size)
+        print(
+            f"{size:>10} instances  {elapsed:8.3f} s  "
+            f"{elapsed / size * 1e6:8.3f} us/instance  "
+            f"registry={len(APIData.CustomInitConnectionList)}"
+        )
+
+    growth = per_instance[-1] / per_instance[0]
+    print(f"per-instance cost growth {sizes[0]} -> {sizes[-1]}: x{growth:.2f}")
+    return 0 if growth <= args.tolerance else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
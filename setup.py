@@ -1,5 +1,8 @@
+import os
 import pathlib
+import sys
 from setuptools import setup
+from setuptools.command.build_py import build_py
 import re
 
 README = (pathlib.Path(__file__).parent / "README.md").read_text()
@@ -13,6 +16,20 @@ with open("requirements.txt") as data:
         line for line in data.read().split("\n") if line and not line.startswith("#")
     ]
 
+
+class build_py_catalog(build_py):
+    """Compile the device catalogs next to the built package, see src/catalog.py"""
+
+    def run(self):
+        super().run()
+
+        sys.path.insert(0, str(pathlib.Path(__file__).parent.absolute()))
+        from src import catalog
+
+        output = os.path.join(self.build_lib, PACKAGE_NAME, "catalog.bin")
+        catalog.compile(output)
+
+
 setup(
     name=PACKAGE_NAME,
     version=VERSION,
@@ -42,4 +59,6 @@ setup(
     packages=[PACKAGE_NAME],
     package_dir={PACKAGE_NAME: SOURCE_DIRECTORY},
     install_requires=requirements,
+    extras_require={"numpy": ["numpy"]},
+    cmdclass={"build_py": build_py_catalog},
 )
@@ -1 +1,10 @@
 from .api import API, APIData
+
+
+def __getattr__(name: str):
+    # preload() is only used by pre-fork servers, it's imported on its first access
+    if name == "preload":
+        from .warmup import preload
+
+        return preload
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,222 @@
+"""
+Generate fleets of APIs from the command line.
+
+    python -m opentele generate --preset TelegramAndroid --count 100000 --output fleet.jsonl
+    python -m opentele generate --preset TelegramDesktop --system windows --ids ids.txt --output fleet.csv
+    python -m opentele generate --preset TelegramAndroid --ids ids.txt --filter manufacturer=Samsung --filter sdk=33..
+    python -m opentele generate --preset TelegramIOS --fleet my-fleet --count 5000 --output fleet.bin
+
+APIs are generated, written and released one chunk at a time, so memory doesn't grow with the
+size of the fleet. A summary with the throughput is printed to stderr once it's done.
+"""
+import argparse
+import concurrent.futures
+import itertools
+import os
+import sys
+import time
+import typing
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .api import API, APIData
+from .devices import DeviceFilter
+from .exception import OpenTeleException
+from . import export
+
+PRESETS = [
+    "TelegramDesktop",
+    "TelegramAndroid",
+    "TelegramAndroidX",
+    "TelegramIOS",
+    "TelegramMacOS",
+]
+
+Batch = Tuple[List[Optional[str]], List[APIData]]
+
+
+def parseValue(value: str) -> Any:
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
+def parseCriterion(value: str) -> Any:
+    """
+    `a,b,c` is a list of values, `a..b` an inclusive range of ints, `a..` and `..b` are open.
+    """
+    if ".." in value:
+        low, _, high = value.partition("..")
+        lowValue = None if low == "" else int(low)
+        highValue = None if high == "" else int(high)
+        return lambda x: (lowValue == None or x >= lowValue) and (
+            highValue == None or x <= highValue
+        )
+
+    if "," in value:
+        return [parseValue(x) for x in value.split(",")]
+
+    return parseValue(value)
+
+
+def parseFilter(values: List[str]) -> Optional[DeviceFilter]:
+    criteria = {}
+    for value in values:
+        name, separator, criterion = value.partition("=")
+        if separator == "" or name == "":
+            raise ValueError(f"Filters are name=value, got {value!r}")
+        criteria[name] = parseCriterion(criterion)
+
+    return DeviceFilter(**criteria) if criteria else None
+
+
+def readIds(path: str) -> Iterator[str]:
+    file = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in file:
+            unique_id = line.rstrip("\r\n")
+            if unique_id:
+                yield unique_id
+    finally:
+        if file is not sys.stdin:
+            file.close()
+
+
+def batches(
+    args: argparse.Namespace,
+    preset: Any,
+    filter: Optional[DeviceFilter],
+    executor: Optional[concurrent.futures.Executor],
+) -> Iterator[Batch]:
+    """
+    The unique IDs and the APIs of every chunk of the fleet.
+    """
+    desktop = preset is API.TelegramDesktop
+    options = {"system": args.system} if desktop else {}
+
+    if args.fleet != None:
+        for offset in range(0, args.count, args.chunk_size):
+            count = min(args.chunk_size, args.count - offset)
+            apis = preset.GenerateFleet(args.fleet, count, offset, layer=args.layer, **options)
+            # members of a fleet aren't generated from a unique ID, see GenerateFleet()
+            yield [None] * count, apis
+        return
+
+    unique_ids: typing.Iterable[Optional[str]] = (
+        readIds(args.ids) if args.ids != None else itertools.repeat(None, args.count)
+    )
+    while True:
+        chunk = list(itertools.islice(unique_ids, args.chunk_size))
+        if len(chunk) == 0:
+            return
+
+        if filter != None or args.stable:
+            # only Generate() can filter and map stably, one unique ID at a time
+            apis = [
+                preset.Generate(*([args.system] if desktop else []), x, filter=filter,
+                                stable=args.stable, layer=args.layer)
+                for x in chunk
+            ]
+        elif executor != None:
+            apis = preset.GenerateParallel(
+                chunk,
+                layer=args.layer,
+                shard_size=-(-len(chunk) // args.workers),
+                executor=executor,
+                **options,
+            )
+        else:
+            apis = preset.GenerateMany(chunk, layer=args.layer, **options)
+
+        yield chunk, apis
+
+
+def generate(args: argparse.Namespace) -> int:
+    preset = getattr(API, args.preset)
+    if args.system != None and preset is not API.TelegramDesktop:
+        raise ValueError("--system is only for TelegramDesktop")
+    if args.fleet != None and (args.ids != None or args.filter or args.stable):
+        raise ValueError("--fleet can't be used with --ids, --filter or --stable")
+    if args.fleet != None and args.count == None:
+        raise ValueError("--fleet needs --count")
+    filter = parseFilter(args.filter)
+
+    if args.output == "-":
+        format = args.format or "jsonl"
+        file = sys.stdout.buffer if format == "bin" else sys.stdout
+        output = export.writer(file, format)
+    else:
+        output = export.writer(args.output, export.formatOf(args.output, args.format))
+
+    # a single pool for the whole run, GenerateParallel() would start one per chunk
+    parallel = args.workers > 1 and args.fleet == None and filter == None and not args.stable
+    executor = concurrent.futures.ProcessPoolExecutor(args.workers) if parallel else None
+
+    begin = time.perf_counter()
+    devices = set()
+    try:
+        with output:
+            for unique_ids, apis in batches(args, preset, filter, executor):
+                output.writeMany(apis, unique_ids)
+                for api in apis:
+                    devices.add((api.device_model, api.system_version))
+                    api.destroy()  # type: ignore
+    finally:
+        if executor != None:
+            executor.shutdown()
+
+    elapsed = time.perf_counter() - begin
+    print(
+        f"{output.count} {args.preset} APIs in {elapsed:.2f} s"
+        f" ({output.count / max(elapsed, 1e-9):,.0f} per second),"
+        f" {len(devices)} distinct devices",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="opentele", description=__doc__.strip().splitlines()[0])  # type: ignore
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    command = commands.add_parser("generate", help="generate a fleet of APIs to a file")
+    command.add_argument("--preset", required=True, choices=PRESETS, help="official client to generate")
+    command.add_argument("--system", choices=["windows", "macos", "linux"], help="OS of TelegramDesktop, default is per unique ID")
+
+    source = command.add_mutually_exclusive_group(required=True)
+    source.add_argument("--ids", help="file of unique IDs, one per line, - for stdin")
+    source.add_argument("--count", type=int, help="number of random APIs, or the size of --fleet")
+    command.add_argument("--fleet", help="generate a fleet of distinct devices with this key, see GenerateFleet()")
+
+    command.add_argument("--filter", action="append", default=[], metavar="NAME=VALUE",
+                         help="device filter, VALUE is a value, a,b,c or an inclusive low..high range")
+    command.add_argument("--stable", action="store_true", help="map unique IDs with consistent hashing")
+    command.add_argument("--layer", type=int, help="only pick app versions of this MTProto layer or older, TelegramDesktop only")
+
+    command.add_argument("--output", default="-", help="output file, - for stdout")
+    command.add_argument("--format", choices=list(export.formats), help="default is the extension of --output")
+    command.add_argument("--chunk-size", type=int, default=10_000, help="APIs held in memory at once")
+    command.add_argument("--workers", type=int, default=1, help="processes that hash the unique IDs")
+
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    try:
+        return generate(args)
+    except (ValueError, NotImplementedError) as error:
+        print(f"opentele: error: {error}", file=sys.stderr)
+        return 2
+    except OpenTeleException as error:
+        print(f"opentele: error: {error.message}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # the reader of stdout is gone, e.g. `| head`, don't fail again when stdout is flushed
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except OSError as error:
+        # e.g. a missing --ids file or an unwritable --output
+        print(f"opentele: error: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,13 @@
 from __future__ import annotations
 import os
+import array
+import functools
+import itertools
+import struct
 
 import platform
 import random
+import weakref
 
 from typing import Any, List, Dict, Type, TypeVar, Union, Optional
 from .devices import *
@@ -11,9 +16,26 @@ from .utils import *
 
 import typing
 
+# app versions, parallel and streaming are only imported by the methods that use them
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+    from .app_versions import AppVersionTable
+
 _T = TypeVar("_T")
 _RT = TypeVar("_RT")
 
+# fields that make up the content of an APIData, pid is not one of them
+CONTENT_FIELDS = (
+    "api_id",
+    "api_hash",
+    "device_model",
+    "system_version",
+    "app_version",
+    "lang_code",
+    "system_lang_code",
+    "lang_pack",
+)
+
 
 class BaseAPIMetaClass(BaseMetaClass):
     """Super high level tactic metaclass"""
@@ -55,6 +77,54 @@ class BaseAPIMetaClass(BaseMetaClass):
         return result + "}"
 
 
+class PIDRegistry(object):
+    """
+    Registry of every `APIData` class and instance, indexed by their `pid`.
+
+    It's backed by a dict so registration and `APIData.findData()` are O(1),
+    but it still iterates, indexes and `append()`s like the list it replaced.
+
+    Entries are weak references: an instance that is no longer used anywhere
+    else is freed and drops out of the registry on its own.
+    """
+
+    def __init__(self) -> None:
+        self.__items: typing.MutableMapping[
+            int, Union[Type[APIData], APIData]
+        ] = weakref.WeakValueDictionary()
+
+    def get(self, pid: int, default: _T = None) -> Union[Type[APIData], APIData, _T]:
+        return self.__items.get(pid, default)
+
+    def append(self, item: Union[Type[APIData], APIData]) -> None:
+        self.__items[item.pid] = item
+
+    def extend(self, items: typing.Iterable[Union[Type[APIData], APIData]]) -> None:
+        self.__items.update((item.pid, item) for item in items)
+
+    def remove(self, item: Union[Type[APIData], APIData]) -> None:
+        if self.__items.get(item.pid) is not item:
+            raise ValueError("PIDRegistry.remove(x): x not in registry")
+        del self.__items[item.pid]
+
+    def discard(self, item: Union[Type[APIData], APIData]) -> None:
+        if self.__items.get(item.pid) is item:
+            del self.__items[item.pid]
+
+    def __contains__(self, item: object) -> bool:
+        pid = getattr(item, "pid", None)
+        return pid is not None and self.__items.get(pid) is item
+
+    def __iter__(self) -> typing.Iterator[Union[Type[APIData], APIData]]:
+        return iter(list(self.__items.values()))
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __getitem__(self, index: int) -> Union[Type[APIData], APIData]:
+        return list(self.__items.values())[index]
+
+
 class APIData(object, metaclass=BaseAPIMetaClass):
     """
     API configuration to connect to `TelegramClient` and `TDesktop`
@@ -86,9 +156,17 @@ class APIData(object, metaclass=BaseAPIMetaClass):
 
     ### Methods:
         `Generate()`: Generate random device model and system version
+
+        `contentEquals()`: Compare the content of two APIs, regardless of their `pid`
+
+        `Deduplicate()`: Remove APIs with the same content in a single pass
+
+    ### Remarks:
+        `==` compares the identity (`pid`) of two APIs, while `hash()` is derived from
+        their content and cached until one of the content fields is changed.
     """
 
-    CustomInitConnectionList: List[Union[Type[APIData], APIData]] = []
+    CustomInitConnectionList: PIDRegistry = PIDRegistry()
 
     api_id: int = None  # type: ignore
     api_hash: str = None  # type: ignore
@@ -162,23 +240,52 @@ class APIData(object, metaclass=BaseAPIMetaClass):
             lang_pack: str = None,
     ) -> None:
 
-        Expects(
-            (self.__class__ != APIData) or (api_id != None and api_hash != None),
-            NoInstanceMatched("No instace of API matches the arguments"),
+        # only build the exception when it's needed, it inspects and formats
+        # the caller's frame, which would also keep a reference to self
+        if self.__class__ == APIData and (api_id == None or api_hash == None):
+            raise NoInstanceMatched("No instace of API matches the arguments")
+
+        self._initData(
+            api_id,
+            api_hash,
+            device_model,
+            system_version,
+            app_version,
+            lang_code,
+            system_lang_code,
+            lang_pack,
         )
 
-        cls = self.get_cls()
+        self._makePID()
+
+    def _initData(
+            self,
+            api_id: int = None,
+            api_hash: str = None,
+            device_model: str = None,
+            system_version: str = None,
+            app_version: str = None,
+            lang_code: str = None,
+            system_lang_code: str = None,
+            lang_pack: str = None,
+    ) -> None:
 
-        self.api_id = api_id if api_id else cls.api_id
-        self.api_hash = api_hash if api_hash else cls.api_hash
-        self.device_model = device_model if device_model else cls.device_model
-        self.system_version = system_version if system_version else cls.system_version
-        self.app_version = app_version if app_version else cls.app_version
-        self.system_lang_code = (
-            system_lang_code if system_lang_code else cls.system_lang_code
+        # not get_cls(), sharemethod keeps a reference to its last caller
+        cls = self.__class__
+
+        # fill __dict__ directly, there is no cached hash for __setattr__ to invalidate yet
+        self.__dict__.update(  # type: ignore
+            api_id=api_id if api_id else cls.api_id,
+            api_hash=api_hash if api_hash else cls.api_hash,
+            device_model=device_model if device_model else cls.device_model,
+            system_version=system_version if system_version else cls.system_version,
+            app_version=app_version if app_version else cls.app_version,
+            system_lang_code=(
+                system_lang_code if system_lang_code else cls.system_lang_code
+            ),
+            lang_pack=lang_pack if lang_pack else cls.lang_pack,
+            lang_code=lang_code if lang_code else cls.lang_code,
         )
-        self.lang_pack = lang_pack if lang_pack else cls.lang_pack
-        self.lang_code = lang_code if lang_code else cls.lang_code
 
         if self.device_model == None:
             system = platform.uname()
@@ -190,8 +297,6 @@ class APIData(object, metaclass=BaseAPIMetaClass):
             else:
                 self.device_model = system.machine
 
-        self._makePID()
-
     @sharemethod
     def copy(glob: Union[Type[_T], _T] = _T) -> _T:  # type: ignore
 
@@ -217,17 +322,83 @@ class APIData(object, metaclass=BaseAPIMetaClass):
         if isinstance(glob, type):
             return
 
-        # might cause conflict, disabled for now, it won"t be a problem
-        # if (API.findData(self.pid) != None):
-        #     API.CustomInitConnectionList.remove(self)
+        # instances that failed in __init__ have no pid of their own,
+        # discard() only evicts the entry if it really is this instance
+        glob.CustomInitConnectionList.discard(glob)  # type: ignore
 
     def __eq__(self, __o: APIData) -> bool:
         if not isinstance(__o, APIData):
             return False
         return self.pid == __o.pid
 
+    def __hash__(self) -> int:
+        # equal pids means the same instance, so the content hash stays consistent with __eq__
+        result = self.__dict__.get("_APIData__contentHash")
+        if result == None:
+            result = self.__contentHash = hash(self.contentKey())
+        return result
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in CONTENT_FIELDS:
+            self.__dict__.pop("_APIData__contentHash", None)  # type: ignore
+
+    def contentKey(self) -> Tuple[Any, ...]:
+        """
+        Content of the API as a tuple, in the order of its attributes.
+        """
+        return (
+            self.api_id,
+            self.api_hash,
+            self.device_model,
+            self.system_version,
+            self.app_version,
+            self.lang_code,
+            self.system_lang_code,
+            self.lang_pack,
+        )
+
+    def contentEquals(self, __o: object) -> bool:
+        """
+        Compare the content of two APIs, unlike `==` which compares their `pid`.
+        """
+        if not isinstance(__o, APIData):
+            return False
+        return hash(self) == hash(__o) and self.contentKey() == __o.contentKey()
+
+    @staticmethod
+    def Deduplicate(apis: typing.Iterable[_T]) -> List[_T]:
+        """
+        Remove APIs with the same content, keeping the first one of each.
+
+        ### Arguments:
+            apis (`Iterable[APIData]`):
+                APIs to deduplicate.
+
+        ### Returns:
+            `List[APIData]`: The unique APIs, in their original order.
+
+        ### Examples:
+        ```python
+            apis = [API.TelegramIOS.Generate(session) for session in sessions]
+            unique = APIData.Deduplicate(apis)
+        ```
+        """
+        results: List[_T] = []
+        buckets: Dict[int, List[APIData]] = {}
+
+        for api in apis:
+            bucket = buckets.setdefault(hash(api), [])  # type: ignore
+
+            if not any(api.contentEquals(x) for x in bucket):  # type: ignore
+                bucket.append(api)  # type: ignore
+                results.append(api)
+
+        return results
+
     def __del__(self):
-        self.destroy()
+        # same as destroy(), without resurrecting self through sharemethod
+        self.CustomInitConnectionList.discard(self)
 
     @classmethod
     def _makePIDEnsure(cls) -> int:
@@ -243,11 +414,156 @@ class APIData(object, metaclass=BaseAPIMetaClass):
         cls.CustomInitConnectionList.append(cls)
 
     def _makePID(self):
-        self.pid = self.get_cls()._makePIDEnsure()
-        self.get_cls().CustomInitConnectionList.append(self)
+        self.pid = self.__class__._makePIDEnsure()
+        self.CustomInitConnectionList.append(self)
+
+    @classmethod
+    def _makePIDsEnsure(cls, count: int) -> List[int]:
+        pids = list(struct.unpack(f"<{count}Q", os.urandom(8 * count)))
+        seen = set()
+
+        for index, pid in enumerate(pids):
+            while pid in seen or cls.findData(pid) != None:
+                pid = cls._makePIDEnsure()
+            seen.add(pid)
+            pids[index] = pid
+
+        return pids
 
     @classmethod
-    def Generate(cls: Type[_T], unique_id: str = None) -> _T:
+    def _makePIDs(cls, apis: List[APIData]):
+        for api, pid in zip(apis, cls._makePIDsEnsure(len(apis))):
+            api.pid = pid
+        cls.CustomInitConnectionList.extend(apis)
+
+    @classmethod
+    def _newMany(
+            cls: Type[_T], devices: List[Tuple[str, str, Optional[str]]]
+    ) -> List[_T]:
+        # Create instances from (device_model, system_version, app_version), registered all at once
+        results: List[_T] = [None] * len(devices)  # type: ignore
+
+        for index, (device_model, system_version, app_version) in enumerate(devices):
+            api = cls.__new__(cls)
+            api._initData(  # type: ignore
+                device_model=device_model,
+                system_version=system_version,
+                app_version=app_version,
+            )
+            results[index] = api
+
+        cls._makePIDs(results)  # type: ignore
+        return results
+
+    @staticmethod
+    def _uniqueIdList(unique_ids: Union[int, typing.Iterable[str]]) -> List[Optional[str]]:
+        if isinstance(unique_ids, int):
+            return [None] * unique_ids
+        return list(unique_ids)
+
+    @classmethod
+    def _systemInfo(cls) -> Type[SystemInfo]:
+        if cls == API.TelegramAndroid or cls == API.TelegramAndroidX:
+            return AndroidDevice
+
+        elif cls == API.TelegramIOS:
+            return iOSDeivce
+
+        elif cls == API.TelegramMacOS:
+            return macOSDevice
+
+        # elif cls == API.TelegramWeb_K or cls == API.TelegramWeb_Z or cls == API.Webogram:
+        else:
+            raise NotImplementedError(
+                f"{cls.__name__} device not supported for randomize yet"
+            )
+
+    @classmethod
+    def _systemInfos(cls, system: str = None) -> List[Type[SystemInfo]]:
+        # the systems a unique ID is picked among, by hash_id % len(systems)
+        return [cls._systemInfo()]  # type: ignore
+
+    @classmethod
+    def _indicesMany(
+            cls, seeds: List[FieldSeeds], system: str = None, layer: int = None
+    ) -> Tuple[array.array, array.array, array.array]:
+        # What GenerateMany() gives to every seed, as compact indices:
+        # the system in _systemInfos(), the device in its deviceList and the app version in the table
+        systemInfos = cls._systemInfos(system)
+        counts = []
+        for systemInfo in systemInfos:
+            systemInfo.__gen__()
+            counts.append(len(systemInfo.deviceList))
+
+        table = cls._appVersions()
+        versionCount = 1 if table == None else len(table._available(layer))
+
+        systems = array.array("B", bytes(len(seeds)))
+        devices = array.array("Q", bytes(8 * len(seeds)))
+        versions = array.array("H", bytes(2 * len(seeds)))
+
+        for index, seed in enumerate(seeds):
+            # same as Generate(): random seeds pick the OS and the device independently
+            systemIndex = (seed["os"] if seed.random else seed.hash_id) % len(systemInfos)
+            systems[index] = systemIndex
+            devices[index] = seed.device_id % counts[systemIndex]
+            if versionCount > 1:
+                versions[index] = seed["app_version"] % versionCount
+
+        return systems, devices, versions
+
+    @classmethod
+    def _fromIndices(
+            cls: Type[_T],
+            indices: Tuple[array.array, array.array, array.array],
+            system: str = None,
+            layer: int = None,
+    ) -> List[_T]:
+        systemInfos = cls._systemInfos(system)  # type: ignore
+        for systemInfo in systemInfos:
+            systemInfo.__gen__()
+        deviceLists = [x.deviceList for x in systemInfos]
+
+        table = cls._appVersions()  # type: ignore
+        versions = [None] if table == None else table.formatted(layer)
+
+        results = []
+        for systemIndex, deviceIndex, versionIndex in zip(*indices):
+            deviceInfo = deviceLists[systemIndex][deviceIndex]
+            results.append((deviceInfo.model, deviceInfo.version, versions[versionIndex]))
+        return cls._newMany(results)  # type: ignore
+
+    @classmethod
+    def _appVersions(cls) -> Optional[AppVersionTable]:
+        from . import app_versions
+
+        if cls == API.TelegramDesktop:
+            return app_versions.tables["tdesktop"]
+
+        # only the current release of the other clients is known, their app_version
+        elif cls in (API.TelegramAndroid, API.TelegramAndroidX, API.TelegramIOS, API.TelegramMacOS):
+            return app_versions.current(cls.app_version)
+
+        return None
+
+    @classmethod
+    def _appVersion(cls, seeds: FieldSeeds = None, layer: int = None) -> Optional[str]:
+        # None keeps the app_version of the preset, for presets without a release table
+        table = cls._appVersions()
+        if table == None:
+            return None
+
+        seed = random.getrandbits(64) if seeds == None else seeds["app_version"]
+        return table.pick(seed, layer)
+
+    @classmethod
+    def Generate(
+            cls: Type[_T],
+            unique_id: str = None,
+            filter: DeviceFilter = None,
+            stable: bool = False,
+            layer: int = None,
+    ) -> _T:
         """
         Generate random device model and system version
 
@@ -256,9 +572,24 @@ class APIData(object, metaclass=BaseAPIMetaClass):
                 The unique ID to generate - can be anything.\\
                 This will be used to ensure that it will generate the same data everytime.\\
                 If not set then the data will be randomized each time we runs it.
+
+            filter (`DeviceFilter`, default=`None`):
+                Only pick among the devices that match this filter, see `DeviceFilter`.
+
+            stable (`bool`, default=`False`):
+                Use a mapping that survives catalog updates: when models or versions are added,
+                only a few unique IDs get a different device. It maps unique IDs to different
+                devices than the default mapping, so don't switch existing sessions to it.
+
+            layer (`int`, default=`None`):
+                Only pick an `app_version` released with this MTProto layer or an older one.\\
+                Default is the layer of the preset, see `app_versions.tables`.\\
+                Only the releases of `TelegramDesktop` have known layers, other presets can't use it.
         
         ### Raises:
             `NotImplementedError`: Not supported for web browser yet
+            `ValueError`: No device matches the filter, no app version is known for the layer,
+            or the preset doesn't know the layers of its releases
 
         ### Returns:
             `APIData`: Return a copy of the api with random device data
@@ -271,29 +602,224 @@ class APIData(object, metaclass=BaseAPIMetaClass):
             client.start()
         ```
         """
-        if cls == API.TelegramAndroid or cls == API.TelegramAndroidX:
-            deviceInfo = AndroidDevice.RandomDevice(unique_id)
+        systemInfo = cls._systemInfo()  # type: ignore
+        seeds = systemInfo._seeds(unique_id)
+        deviceInfo = systemInfo._SeededDevice(seeds, filter=filter, stable=stable)
 
-        elif cls == API.TelegramIOS:
-            deviceInfo = iOSDeivce.RandomDevice(unique_id)
+        return cls(
+            device_model=deviceInfo.model,
+            system_version=deviceInfo.version,
+            app_version=cls._appVersion(seeds, layer),  # type: ignore
+        )
 
-        elif cls == API.TelegramMacOS:
-            deviceInfo = macOSDevice.RandomDevice(unique_id)
+    @classmethod
+    def GenerateMany(
+            cls: Type[_T], unique_ids: Union[int, typing.Iterable[str]], *, layer: int = None
+    ) -> List[_T]:
+        """
+        Generate random device data for many APIs at once.\\
+        Each API gets exactly the same device data that `Generate()` would give to its `unique_id`.
 
-        # elif cls == API.TelegramWeb_K or cls == API.TelegramWeb_Z or cls == API.Webogram:
-        else:
-            raise NotImplementedError(
-                f"{cls.__name__} device not supported for randomize yet"
-            )
+        ### Arguments:
+            unique_ids (`Iterable[str]` | `int`):
+                The unique IDs to generate, see `Generate()`.\\
+                Or the number of APIs to generate, each of them randomized.
+
+            layer (`int`, default=`None`):
+                Only pick app versions released with this MTProto layer or an older one, see `Generate()`.
+
+        ### Raises:
+            `NotImplementedError`: Not supported for web browser yet
+
+        ### Returns:
+            `List[APIData]`: A copy of the api with random device data for each unique ID, in the same order
 
-        return cls(device_model=deviceInfo.model, system_version=deviceInfo.version)
+        ### Examples:
+        ```python
+            apis = API.TelegramIOS.GenerateMany(["first.session", "second.session"])
+            randoms = API.TelegramAndroid.GenerateMany(1000)
+        ```
+        """
+        seeds = SystemInfo._seedsMany(cls._uniqueIdList(unique_ids))  # type: ignore
+        return cls._fromIndices(cls._indicesMany(seeds, layer=layer), layer=layer)  # type: ignore
+
+    @classmethod
+    def GenerateParallel(
+            cls: Type[_T],
+            unique_ids: typing.Iterable[str],
+            *,
+            layer: int = None,
+            workers: int = None,
+            shard_size: int = 65536,
+            executor: concurrent.futures.Executor = None,
+    ) -> List[_T]:
+        """
+        Same as `GenerateMany()`, with the unique IDs hashed by a pool of processes.\\
+        The results are exactly the same as `GenerateMany()`, whatever the number of workers.
+
+        Unique IDs are split in shards of `shard_size`, and every worker only sends back the
+        indices of the devices and app versions of its shard. The APIs themselves are created in
+        this process, in the same order as `unique_ids`.
+
+        ### Arguments:
+            unique_ids (`Iterable[str]`):
+                The unique IDs to generate, see `Generate()`.
+
+            layer (`int`, default=`None`):
+                Only pick app versions released with this MTProto layer or an older one, see `Generate()`.
+
+            workers (`int`, default=`None`):
+                Number of processes, default is the number of CPUs.
+
+            shard_size (`int`, default=`65536`):
+                Number of unique IDs sent to a worker at once.\\
+                Lists that fit in a single shard are generated in this process.
+
+            executor (`ProcessPoolExecutor`, default=`None`):
+                Pool to map the shards on, instead of a new one of `workers` processes.\\
+                Pass the same pool to many calls, so that they don't each start their own.
+
+        ### Raises:
+            `NotImplementedError`: Not supported for web browser yet
+
+        ### Returns:
+            `List[APIData]`: A copy of the api with random device data for each unique ID, in the same order
+
+        ### Examples:
+        ```python
+            if __name__ == "__main__":
+                apis = API.TelegramAndroid.GenerateParallel(f"user{x}" for x in range(1_000_000))
+        ```
+        """
+        from . import parallel
+
+        indices = parallel.indicesMany(
+            cls, unique_ids, None, layer, workers, shard_size, executor
+        )
+        return cls._fromIndices(indices, layer=layer)  # type: ignore
+
+    @classmethod
+    def GenerateStream(
+            cls: Type[_T],
+            unique_ids: Union[int, typing.Iterable[str]],
+            chunk_size: int = 1000,
+            *,
+            layer: int = None,
+            prefetch: int = 1,
+            executor: concurrent.futures.Executor = None,
+    ) -> typing.AsyncIterator[List[_T]]:
+        """
+        Generate APIs from asyncio, in chunks, without blocking the event loop.\\
+        Each chunk is what `GenerateMany()` gives to its unique IDs.
+
+        Chunks are generated in a worker thread, the first one also builds the device catalog.
+        Only `prefetch` chunks are generated ahead of the consumer, so a slow consumer
+        doesn't make the stream hold more than `(prefetch + 1) * chunk_size` APIs.
+
+        ### Arguments:
+            unique_ids (`Iterable[str]` | `int`):
+                The unique IDs to generate, see `Generate()`.\\
+                Or the number of APIs to generate, each of them randomized.
+
+            chunk_size (`int`, default=`1000`):
+                Number of APIs per chunk.
+
+            layer (`int`, default=`None`):
+                Only pick app versions released with this MTProto layer or an older one, see `Generate()`.
+
+            prefetch (`int`, default=`1`):
+                Number of chunks generated ahead of the consumer.
+
+            executor (`Executor`, default=`None`):
+                Where the chunks are generated, default is a thread of this stream.
+
+        ### Raises:
+            `NotImplementedError`: Not supported for web browser yet
+
+        ### Returns:
+            `AsyncIterator[List[APIData]]`: The APIs of every chunk, in the same order as `unique_ids`
+
+        ### Examples:
+        ```python
+            async for apis in API.TelegramAndroid.GenerateStream(unique_ids, chunk_size=500):
+                await provision(apis)
+        ```
+        """
+        from . import streaming
+
+        return streaming.chunks(
+            functools.partial(cls.GenerateMany, layer=layer),  # type: ignore
+            cls._uniqueIdStream(unique_ids),  # type: ignore
+            chunk_size,
+            prefetch,
+            executor,
+        )
+
+    @staticmethod
+    def _uniqueIdStream(
+            unique_ids: Union[int, typing.Iterable[str]]
+    ) -> typing.Iterable[Optional[str]]:
+        if isinstance(unique_ids, int):
+            return itertools.repeat(None, unique_ids)
+        return unique_ids
+
+    @classmethod
+    def GenerateFleet(
+            cls: Type[_T], fleet_key: str, count: int, offset: int = 0, *, layer: int = None
+    ) -> List[_T]:
+        """
+        Generate APIs that are guaranteed to have distinct devices.\\
+        Unlike `GenerateMany()`, no two APIs of a fleet can ever get the same device.
+
+        ### Arguments:
+            fleet_key (`str`):
+                The key of the fleet - can be anything.\\
+                The same key always gives the same devices in the same order.
+
+            count (`int`):
+                The number of APIs to generate.
+
+            offset (`int`, default=`0`):
+                How many APIs of this fleet were already generated.\\
+                To grow a fleet, pass the number of APIs it already has.
+
+            layer (`int`, default=`None`):
+                Only pick app versions released with this MTProto layer or an older one, see `Generate()`.
+
+        ### Raises:
+            `NotImplementedError`: Not supported for web browser yet
+            `OpenTeleException`: The fleet would be bigger than the device catalog
+
+        ### Returns:
+            `List[APIData]`: A copy of the api with distinct device data for each member of the fleet
+
+        ### Examples:
+        ```python
+            apis = API.TelegramAndroid.GenerateFleet("my-fleet", 1000)
+            more = API.TelegramAndroid.GenerateFleet("my-fleet", 500, offset=1000)
+        ```
+        """
+        fleet = cls._systemInfo().Permutation(fleet_key)  # type: ignore
+        Expects(
+            0 <= offset and offset + count <= len(fleet),
+            f"Fleet of {offset + count} devices doesn't fit in {len(fleet)} devices",
+        )
+
+        # every member of the fleet is seeded by its position
+        seeds = SystemInfo._seedsMany(
+            f"{fleet_key}/{offset + position}" for position in range(count)
+        )
+        devices = fleet[offset : offset + count]
+        return cls._newMany(  # type: ignore
+            [
+                (x.model, x.version, cls._appVersion(seed, layer))  # type: ignore
+                for x, seed in zip(devices, seeds)
+            ]
+        )
 
     @classmethod
     def findData(cls: Type[_T], pid: int) -> Optional[_T]:
-        for x in cls.CustomInitConnectionList:  # type: ignore
-            if x.pid == pid:
-                return x
-        return None
+        return cls.CustomInitConnectionList.get(pid)  # type: ignore
 
 
 class API(BaseObject):
@@ -362,7 +888,13 @@ class API(BaseObject):
         @typing.overload
         @classmethod
         def Generate(
-                cls: Type[_T], system: str = "windows", unique_id: str = None
+                cls: Type[_T],
+                system: Optional[str],
+                unique_id: Optional[str] = None,
+                weights: Optional[DeviceWeights] = None,
+                filter: Optional[DeviceFilter] = None,
+                stable: bool = False,
+                layer: Optional[int] = None,
         ) -> _T:
             """
             Generate random TelegramDesktop devices
@@ -375,6 +907,22 @@ class API(BaseObject):
                     The unique ID to generate - can be anything.\\
                     This ID will be used to ensure that it will generate the same data every single time.\\
                     If not set then the data will be randomized each time we runs it.
+
+                weights (`DeviceWeights`, default=`None`):
+                    Pick Windows and Linux device models by their weights instead of uniformly.\\
+                    For example newer models or laptops more often, see `DeviceWeights`.\\
+                    macOS devices don't have the metadata, they are always picked uniformly.
+
+                filter (`DeviceFilter`, default=`None`):
+                    Only pick among the devices that match this filter, see `DeviceFilter`.\\
+                    Set the `system` too when the filter uses attributes that only some OS have.
+
+                stable (`bool`, default=`False`):
+                    Use a mapping that survives catalog updates, see `APIData.Generate()`.
+
+                layer (`int`, default=`None`):
+                    Only pick an `app_version` released with this MTProto layer or an older one.\\
+                    Default is layer 216, see `app_versions.tables`.
             
             ### Returns:
                 `APIData`: Return a copy of the api with random device data
@@ -402,88 +950,225 @@ class API(BaseObject):
 
         @typing.overload
         @classmethod
-        def Generate(cls: Type[_T], system: str = "macos", unique_id: str = None) -> _T:
+        def Generate(
+                cls: Type[_T],
+                *,
+                unique_id: Optional[str] = None,
+                weights: Optional[DeviceWeights] = None,
+                filter: Optional[DeviceFilter] = None,
+                stable: bool = False,
+                layer: Optional[int] = None,
+        ) -> _T:
             pass
 
-        @typing.overload
         @classmethod
-        def Generate(cls: Type[_T], system: str = "linux", unique_id: str = None) -> _T:
-            pass
+        def _generate_tdesktop_app_version(cls, seeds: FieldSeeds = None, layer: int = None):
+            return cls._appVersion(seeds, layer)
 
-        @typing.overload
         @classmethod
-        def Generate(
-                cls: Type[_T], system: str = "random", unique_id: str = None
-        ) -> _T:
-            pass
+        def _systemInfos(cls, system: str = None) -> List[Type[SystemInfo]]:
+            systems = {
+                "windows": WindowsDevice,
+                "macos": macOSDevice,
+                "linux": LinuxDevice,
+            }
+            if system == None or system not in systems:
+                return [WindowsDevice, macOSDevice, LinuxDevice]
+
+            return [systems[system]]
 
         @classmethod
-        def _generate_tdesktop_app_version(cls):
-            app_versions = [
-                # "6.4.2",
-                # "6.4.1",
-                # "6.4.0",
-                # ^ layer 221 after 10/10/2025
-                "6.2.6",
-                "6.2.5",
-                "6.2.4",
-                "6.2.3",
-                # ^ layer 216 after 10/10/2025
-
-                # "6.0.2",
-                # "6.0.1",
-                # "6.0.0",
-                # "5.16.6",
-                # "5.16.5",
-                # "5.16.4",
-                # "5.16.3",
-                # "5.16.2",
-                # "5.16.1",
-                # "5.16.0",
-                # "5.15.4",
-                # "5.15.3",
-                # "5.15.2",
-                # "5.15.1",
-                # "5.15.0",
-                # "5.14.3",
-                # "5.14.2",
-                # "5.14.1",
-                # "5.14.0",
-                # "5.13.1",
-                # "5.13.0",
-                # "5.12.6",
-                # "5.12.5",
-                # "5.12.4",
-                # "5.12.3",
-                # "5.12.2",
-                # "5.12.1",
-                # "5.12.0"
-            ]
-            return f'{random.choice(app_versions)} x64'
+        def _filteredSystems(cls, filter: DeviceFilter) -> List[str]:
+            # e.g. macOS has no model metadata, a filter on year or type can't match it
+            systems = []
+            error = None
+            for name, systemInfo in zip(["windows", "macos", "linux"], cls._systemInfos()):
+                try:
+                    systemInfo.FilteredDevices(filter)
+                except ValueError as e:
+                    error = e
+                else:
+                    systems.append(name)
+
+            if len(systems) == 0:
+                raise error  # type: ignore
+            return systems
 
         @classmethod
-        def Generate(cls: Type[_T], system: str = None, unique_id: str = None) -> _T:
+        def Generate(
+                cls: Type[_T],
+                system: Optional[str] = None,
+                unique_id: Optional[str] = None,
+                weights: Optional[DeviceWeights] = None,
+                filter: Optional[DeviceFilter] = None,
+                stable: bool = False,
+                layer: Optional[int] = None,
+        ) -> _T:
+
+            # a single sha1 of unique_id seeds every field
+            seeds = SystemInfo._seeds(unique_id)
 
             validList = ["windows", "macos", "linux"]
             if system == None or system not in validList:
+                # a filter can only pick among the systems that have devices matching it
+                if filter != None:
+                    validList = cls._filteredSystems(filter)  # type: ignore
                 system = SystemInfo._hashtovalue(
-                    SystemInfo._strtohashid(unique_id), validList
+                    seeds["os"] if stable or filter != None or seeds.random else seeds.hash_id,
+                    validList,
                 )
 
             system = system.lower()
 
             if system == "windows":
-                deviceInfo = WindowsDevice.RandomDevice(unique_id)
+                deviceInfo = WindowsDevice._SeededDevice(seeds, weights, filter, stable)
 
             elif system == "macos":
-                deviceInfo = macOSDevice.RandomDevice(unique_id)
+                deviceInfo = macOSDevice._SeededDevice(seeds, filter=filter, stable=stable)
 
             else:
-                deviceInfo = LinuxDevice.RandomDevice(unique_id)
+                deviceInfo = LinuxDevice._SeededDevice(seeds, weights, filter, stable)
 
             return cls(device_model=deviceInfo.model,
                        system_version=deviceInfo.version,
-                       app_version=cls._generate_tdesktop_app_version())
+                       app_version=cls._generate_tdesktop_app_version(seeds, layer))
+
+        @classmethod
+        def GenerateMany(
+                cls: Type[_T],
+                unique_ids: Union[int, typing.Iterable[str]],
+                system: str = None,
+                *,
+                layer: int = None,
+        ) -> List[_T]:
+            """
+            Generate many random TelegramDesktop devices at once.\\
+            Each API gets exactly the same device data that `Generate()` would give to its `unique_id`.
+
+            ### Arguments:
+                unique_ids (`Iterable[str]` | `int`):
+                    The unique IDs to generate, see `Generate()`.\\
+                    Or the number of APIs to generate, each of them randomized.
+
+                system (`str`, default=`"random"`):
+                    Which OS to generate, either `"windows"`, `"macos"`, or `"linux"`.\\
+                    Default is `None` or `"random"` -  which means it will be selected per unique ID.
+
+                layer (`int`, default=`None`):
+                    Only pick app versions released with this MTProto layer or an older one, see `Generate()`.
+
+            ### Returns:
+                `List[APIData]`: A copy of the api with random device data for each unique ID, in the same order
+            """
+            seeds = SystemInfo._seedsMany(cls._uniqueIdList(unique_ids))  # type: ignore
+            indices = cls._indicesMany(seeds, system, layer)  # type: ignore
+            return cls._fromIndices(indices, system, layer)  # type: ignore
+
+        @classmethod
+        def GenerateParallel(
+                cls: Type[_T],
+                unique_ids: typing.Iterable[str],
+                system: str = None,
+                *,
+                layer: int = None,
+                workers: int = None,
+                shard_size: int = 65536,
+                executor: concurrent.futures.Executor = None,
+        ) -> List[_T]:
+            """
+            Same as `GenerateMany()`, with the unique IDs hashed by a pool of processes, see `APIData.GenerateParallel()`.
+
+            ### Arguments:
+                system (`str`, default=`"random"`):
+                    Which OS to generate, either `"windows"`, `"macos"`, or `"linux"`.\\
+                    Default is `None` or `"random"` -  which means it will be selected per unique ID.
+            """
+            from . import parallel
+
+            indices = parallel.indicesMany(
+                cls, unique_ids, system, layer, workers, shard_size, executor
+            )
+            return cls._fromIndices(indices, system, layer)  # type: ignore
+
+        @classmethod
+        def GenerateStream(
+                cls: Type[_T],
+                unique_ids: Union[int, typing.Iterable[str]],
+                chunk_size: int = 1000,
+                system: str = None,
+                *,
+                layer: int = None,
+                prefetch: int = 1,
+                executor: concurrent.futures.Executor = None,
+        ) -> typing.AsyncIterator[List[_T]]:
+            """
+            Generate TelegramDesktop APIs from asyncio, in chunks, see `APIData.GenerateStream()`.
+
+            ### Arguments:
+                system (`str`, default=`"random"`):
+                    Which OS to generate, either `"windows"`, `"macos"`, or `"linux"`.\\
+                    Default is `None` or `"random"` -  which means it will be selected per unique ID.
+            """
+            from . import streaming
+
+            return streaming.chunks(
+                functools.partial(cls.GenerateMany, system=system, layer=layer),  # type: ignore
+                cls._uniqueIdStream(unique_ids),  # type: ignore
+                chunk_size,
+                prefetch,
+                executor,
+            )
+
+        @classmethod
+        def GenerateFleet(
+                cls: Type[_T],
+                fleet_key: str,
+                count: int,
+                offset: int = 0,
+                system: str = None,
+                *,
+                layer: int = None,
+        ) -> List[_T]:
+            """
+            Generate TelegramDesktop APIs that are guaranteed to have distinct devices, see `APIData.GenerateFleet()`.
+
+            ### Arguments:
+                system (`str`, default=`"random"`):
+                    Which OS to generate, either `"windows"`, `"macos"`, or `"linux"`.\\
+                    Default is `None` or `"random"` -  which means it will be selected by the fleet key.
+
+                layer (`int`, default=`None`):
+                    Only pick app versions released with this MTProto layer or an older one, see `Generate()`.
+            """
+            systems = {
+                "windows": WindowsDevice,
+                "macos": macOSDevice,
+                "linux": LinuxDevice,
+            }
+            validList = ["windows", "macos", "linux"]
+            if system == None or system not in validList:
+                system = SystemInfo._hashtovalue(
+                    SystemInfo._strtohashid(str(fleet_key)), validList
+                )
+
+            fleet = systems[system].Permutation(fleet_key)
+            Expects(
+                0 <= offset and offset + count <= len(fleet),
+                f"Fleet of {offset + count} devices doesn't fit in {len(fleet)} devices",
+            )
+
+            # every member of the fleet is seeded by its position
+            devices = [
+                (
+                    x.model,
+                    x.version,
+                    cls._generate_tdesktop_app_version(  # type: ignore
+                        SystemInfo._seeds(f"{fleet_key}/{offset + position}"), layer
+                    ),
+                )
+                for position, x in enumerate(fleet[offset : offset + count])
+            ]
+            return cls._newMany(devices)  # type: ignore
 
     class TelegramAndroid(APIData):
         """
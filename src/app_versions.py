@@ -0,0 +1,183 @@
+"""
+Release history of the official clients, used to pick the `app_version` of generated APIs.
+"""
+from __future__ import annotations
+
+import bisect
+import functools
+import typing
+from typing import Dict, List
+
+if typing.TYPE_CHECKING:
+    import datetime
+
+
+class AppVersion(object):
+    """
+    A release of an official client.
+
+    ### Attributes:
+        version (`str`):
+            The version, as the client reports it.
+
+        layer (`int`):
+            MTProto layer of the release, `None` if it's not known.
+
+        released (`datetime.date`):
+            Release date, `None` if it's not known.
+    """
+
+    __slots__ = ("version", "layer", "released")
+
+    def __init__(
+        self, version: str, layer: int = None, released: datetime.date = None
+    ) -> None:
+        self.version = version
+        self.layer = layer
+        self.released = released
+
+    def __repr__(self) -> str:
+        return f"AppVersion({self.version!r}, layer={self.layer})"
+
+
+class AppVersionTable(object):
+    """
+    The releases of a client, newest first, indexed by MTProto layer.
+
+    For every known layer, the releases that use that layer or an older one are precomputed,
+    so picking among the latest N versions compatible with a layer is O(1) after a binary search
+    over the layers.
+
+    ### Arguments:
+        versions (`List[AppVersion]`):
+            The releases, newest first.
+
+        format (`str`, default=`"{}"`):
+            How a version is formatted into `app_version`.
+
+        layer (`int`, default=`None`):
+            Layer that generated APIs use by default, `None` to use every release.
+    """
+
+    def __init__(
+        self, versions: List[AppVersion], format: str = "{}", layer: int = None
+    ) -> None:
+        self.versions = tuple(versions)
+        self.format = format
+        self.layer = layer
+
+        self.layers = sorted({x.layer for x in versions if x.layer != None})
+        self.compatibles = [
+            tuple(x for x in versions if x.layer != None and x.layer <= layer)
+            for layer in self.layers
+        ]
+
+    def compatible(self, layer: int = None) -> typing.Sequence[AppVersion]:
+        """
+        The releases that use `layer` or an older one, newest first.
+
+        Default is the layer of the table, or every release if it doesn't have one.
+        """
+        if layer == None:
+            layer = self.layer
+            if layer == None:
+                return self.versions
+
+        index = bisect.bisect_right(self.layers, layer) - 1
+        return self.compatibles[index] if index >= 0 else ()
+
+    def latest(self, count: int, layer: int = None) -> List[AppVersion]:
+        return list(self.compatible(layer)[:count])
+
+    def formatted(self, layer: int = None) -> List[str]:
+        """
+        The `app_version` of every release compatible with `layer`, newest first.
+
+        ### Raises:
+            `ValueError`: No release is known to be compatible with the layer, or the table
+            doesn't know the layer of any release.
+        """
+        return [self.format.format(x.version) for x in self._available(layer)]
+
+    def pick(self, seed: int, layer: int = None) -> str:
+        """
+        The `app_version` of a seed, among the releases compatible with `layer`.
+
+        ### Raises:
+            `ValueError`: No release is known to be compatible with the layer, or the table
+            doesn't know the layer of any release.
+        """
+        versions = self._available(layer)
+        return self.format.format(versions[seed % len(versions)].version)
+
+    def _available(self, layer: int = None) -> typing.Sequence[AppVersion]:
+        if layer != None and len(self.layers) == 0:
+            raise ValueError(
+                f"The MTProto layer of {', '.join(x.version for x in self.versions)} isn't known,"
+                " layer can't be used"
+            )
+
+        versions = self.compatible(layer)
+        if len(versions) == 0:
+            raise ValueError(f"No app version is known to use layer {layer} or older")
+        return versions
+
+    def __repr__(self) -> str:
+        return f"AppVersionTable({', '.join(x.version for x in self.versions)})"
+
+
+# fmt: off
+tables: Dict[str, AppVersionTable] = {
+
+    # layers as of 10/10/2025, versions before 6.2.3 were used with unknown layers
+    "tdesktop": AppVersionTable(
+        [
+            AppVersion("6.4.2", 221),
+            AppVersion("6.4.1", 221),
+            AppVersion("6.4.0", 221),
+            AppVersion("6.2.6", 216),
+            AppVersion("6.2.5", 216),
+            AppVersion("6.2.4", 216),
+            AppVersion("6.2.3", 216),
+            AppVersion("6.0.2"),
+            AppVersion("6.0.1"),
+            AppVersion("6.0.0"),
+            AppVersion("5.16.6"),
+            AppVersion("5.16.5"),
+            AppVersion("5.16.4"),
+            AppVersion("5.16.3"),
+            AppVersion("5.16.2"),
+            AppVersion("5.16.1"),
+            AppVersion("5.16.0"),
+            AppVersion("5.15.4"),
+            AppVersion("5.15.3"),
+            AppVersion("5.15.2"),
+            AppVersion("5.15.1"),
+            AppVersion("5.15.0"),
+            AppVersion("5.14.3"),
+            AppVersion("5.14.2"),
+            AppVersion("5.14.1"),
+            AppVersion("5.14.0"),
+            AppVersion("5.13.1"),
+            AppVersion("5.13.0"),
+            AppVersion("5.12.6"),
+            AppVersion("5.12.5"),
+            AppVersion("5.12.4"),
+            AppVersion("5.12.3"),
+            AppVersion("5.12.2"),
+            AppVersion("5.12.1"),
+            AppVersion("5.12.0"),
+        ],
+        format="{} x64",
+        layer=216,
+    ),
+}
+# fmt: on
+
+
+@functools.lru_cache(maxsize=None)
+def current(version: str) -> AppVersionTable:
+    """
+    A table of a single release, for the clients whose release history isn't in `tables`.
+    """
+    return AppVersionTable([AppVersion(version)])
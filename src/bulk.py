@@ -0,0 +1,108 @@
+"""
+Hash ids of many unique IDs at once, vectorized with NumPy when it's installed.
+
+The hash id of a unique ID is its sha1 digest reduced modulo `10**12`, see
+`SystemInfo._strtohashid()`. The digests still have to be computed one at a time by hashlib,
+but the reduction and the catalog indices are computed on whole arrays: the 160-bit digests
+are split in ten 16-bit chunks, and reduced with Horner's method so that every intermediate
+value stays below `10**12 * 2**16 < 2**64`.
+
+Without NumPy the same functions fall back to plain Python, and return `array.array`
+instead of `numpy.ndarray`.
+"""
+from __future__ import annotations
+
+import array
+import hashlib
+import os
+from typing import Any, Iterable, Optional
+
+# NumPy is only imported when it's first used, it'd take longer than the whole package
+_numpy: Any = False
+
+
+def _loadNumpy() -> Any:
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+DIGEST_SIZE = 20
+HASH_ID_MODULO = 10 ** 12
+
+
+def available() -> bool:
+    """
+    Whether the vectorized path is used, that is NumPy is installed.
+    """
+    return _loadNumpy() != None
+
+
+def digests(unique_ids: Iterable[Optional[str]]) -> bytes:
+    """
+    The sha1 digests of `unique_ids`, concatenated.\\
+    `None` gets the digest of random bytes, just like `SystemInfo._strtohashid()`.
+    """
+    sha1 = hashlib.sha1
+    results = []
+    for unique_id in unique_ids:
+        if unique_id == None:
+            results.append(sha1(os.urandom(32)).digest())
+        elif isinstance(unique_id, str):
+            results.append(sha1(unique_id.encode("utf-8")).digest())
+        else:
+            results.append(sha1(str(unique_id).encode("utf-8")).digest())
+    return b"".join(results)
+
+
+def reduce(data: bytes, modulo: int = HASH_ID_MODULO):
+    """
+    Every 20-byte big-endian digest of `data` modulo `modulo`, which must be below `2**48`.
+
+    ### Returns:
+        `numpy.ndarray` of `uint64` with NumPy, else `array.array` of `"Q"`.
+    """
+    numpy = _loadNumpy()
+    if numpy == None:
+        return array.array(
+            "Q",
+            (
+                int.from_bytes(data[offset : offset + DIGEST_SIZE], "big") % modulo
+                for offset in range(0, len(data), DIGEST_SIZE)
+            ),
+        )
+
+    chunks = numpy.frombuffer(data, dtype=">u2").reshape(-1, DIGEST_SIZE // 2)
+    results = numpy.zeros(len(chunks), dtype=numpy.uint64)
+    shift = numpy.uint64(16)
+    divisor = numpy.uint64(modulo)
+
+    for column in range(chunks.shape[1]):
+        results <<= shift
+        results |= chunks[:, column]
+        results %= divisor
+    return results
+
+
+def hashIds(unique_ids: Iterable[Optional[str]]):
+    """
+    The hash ids of `unique_ids`, bit for bit the same as `SystemInfo._strtohashids()`.
+    """
+    return reduce(digests(unique_ids))
+
+
+def indices(hash_ids, count: int):
+    """
+    The catalog index of every hash id, for a catalog of `count` devices.
+    """
+    numpy = _loadNumpy()
+    if numpy != None and isinstance(hash_ids, numpy.ndarray):
+        return hash_ids % numpy.uint64(count)
+
+    return array.array("Q", (hash_id % count for hash_id in hash_ids))
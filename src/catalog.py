@@ -0,0 +1,334 @@
+"""
+Precompiled device catalogs, memory-mapped read-only.
+
+`compile()` writes the catalogs defined in `devices.py` to a compact binary file and `load()`
+memory-maps it, so every process using opentele shares a single physical copy of the catalogs
+and importing them doesn't allocate anything per row.
+
+The file is laid out as:
+    header      magic, format version, sha1 of the catalog sources, number of tables
+    directory   one fixed-width entry per table: name, kind, item count, offset
+    tables      string tables: (count + 1) uint32 offsets followed by the utf-8 blob
+                record tables: fixed-width records, see `DESKTOP_RECORD`
+
+Every platform has a `layout/<platform>` string table with one item per `DeviceSpace` segment,
+naming how a `DeviceInfo` is built from its dimensions and how many dimensions it has. Each
+dimension is the string table `<platform>/<segment>/<dimension>`.
+
+Compile it with `python -m opentele.catalog [path]`, `setup.py` does it when building the package.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+import typing
+
+MAGIC = b"OTCATLG\0"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<8sI20sI")
+DIRECTORY_ENTRY = struct.Struct("<32sIII")
+OFFSET = struct.Struct("<I")
+
+KIND_STRINGS = 0
+KIND_RECORDS = 1
+
+# key, manufacturer, name and type are indices into the desktop/* string tables
+DESKTOP_RECORD = struct.Struct("<IIIHH")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog.bin")
+
+# the catalog is only used if it was compiled from these exact sources
+SOURCES = [
+    "devices.py",
+    "devices_desktop.py",
+    "devices_macos.py",
+    "devices_android.py",
+    "devices_ios.py",
+]
+
+
+def source_digest() -> bytes:
+    digest = hashlib.sha1()
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    for source in SOURCES:
+        with open(os.path.join(base_dir, source), "rb") as file:
+            digest.update(file.read())
+
+    return digest.digest()
+
+
+class MappedStrings(typing.Sequence[str]):
+    """
+    A string table of the catalog, items are only decoded when accessed.
+    """
+
+    def __init__(self, buffer: mmap.mmap, offset: int, count: int) -> None:
+        self.buffer = buffer
+        self.offset = offset
+        self.size = count
+        self.blob = offset + OFFSET.size * (count + 1)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @typing.overload
+    def __getitem__(self, index: int) -> str:
+        pass
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> typing.List[str]:
+        pass
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(self.size))]
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("MappedStrings index out of range")
+
+        begin, end = struct.unpack_from("<II", self.buffer, self.offset + OFFSET.size * index)
+        return self.buffer[self.blob + begin : self.blob + end].decode("utf-8")
+
+
+class MappedRecords(typing.Sequence[typing.Tuple[int, ...]]):
+    """
+    A table of fixed-width records, items are only unpacked when accessed.
+    """
+
+    def __init__(
+        self, buffer: mmap.mmap, offset: int, count: int, record: struct.Struct
+    ) -> None:
+        self.buffer = buffer
+        self.offset = offset
+        self.size = count
+        self.record = record
+
+    def __len__(self) -> int:
+        return self.size
+
+    @typing.overload
+    def __getitem__(self, index: int) -> typing.Tuple[int, ...]:
+        pass
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> typing.List[typing.Tuple[int, ...]]:
+        pass
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(self.size))]
+
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("MappedRecords index out of range")
+
+        return self.record.unpack_from(self.buffer, self.offset + self.record.size * index)
+
+
+class MappedCatalog(object):
+    """
+    A compiled catalog file, memory-mapped read-only.
+
+    ### Raises:
+        `ValueError`: The file is not a catalog or was compiled from different sources.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]) -> None:
+
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, digest, count = HEADER.unpack_from(self.buffer, 0)
+
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a compatible device catalog")
+
+        if digest != source_digest():
+            raise ValueError(f"{path} was compiled from different sources")
+
+        self.tables: typing.Dict[str, typing.Tuple[int, int, int]] = {}
+        for index in range(count):
+            name, kind, items, offset = DIRECTORY_ENTRY.unpack_from(
+                self.buffer, HEADER.size + DIRECTORY_ENTRY.size * index
+            )
+            self.tables[name.rstrip(b"\0").decode("utf-8")] = (kind, items, offset)
+
+    def strings(self, name: str) -> MappedStrings:
+        kind, count, offset = self.tables[name]
+        assert kind == KIND_STRINGS
+        return MappedStrings(self.buffer, offset, count)
+
+    def records(self, name: str, record: struct.Struct) -> MappedRecords:
+        kind, count, offset = self.tables[name]
+        assert kind == KIND_RECORDS
+        return MappedRecords(self.buffer, offset, count, record)
+
+    def __contains__(self, platform: str) -> bool:
+        return f"layout/{platform}" in self.tables
+
+    def layout(self, platform: str) -> typing.List[typing.Tuple[str, int]]:
+        results = []
+        for segment in self.strings(f"layout/{platform}"):
+            build, dimensions = segment.split(":")
+            results.append((build, int(dimensions)))
+        return results
+
+    def dimensions(
+        self, platform: str
+    ) -> typing.List[typing.Tuple[str, typing.List[MappedStrings]]]:
+        """
+        Build name and dimensions of every `DeviceSpace` segment of a platform.
+        """
+        return [
+            (
+                build,
+                [
+                    self.strings(f"{platform}/{segment}/{dimension}")
+                    for dimension in range(dimensions)
+                ],
+            )
+            for segment, (build, dimensions) in enumerate(self.layout(platform))
+        ]
+
+    def desktopModels(
+        self,
+    ) -> typing.Iterator[typing.Tuple[str, str, str, int, str]]:
+        """
+        The metadata of `GeneralDesktopDevice.device_models`, as (key, manufacturer, model, year, type).
+        """
+        keys = self.strings("desktop/keys")
+        manufacturers = self.strings("desktop/manufacturers")
+        names = self.strings("desktop/names")
+        types = self.strings("desktop/types")
+
+        for key, manufacturer, name, year, type in self.records(
+            "desktop/records", DESKTOP_RECORD
+        ):
+            yield keys[key], manufacturers[manufacturer], names[name], year, types[type]
+
+    def close(self) -> None:
+        self.buffer.close()
+
+
+_loaded: typing.Dict[str, typing.Optional[MappedCatalog]] = {}
+_loadLock = threading.Lock()
+
+
+def load(
+    path: typing.Union[str, os.PathLike] = None
+) -> typing.Optional[MappedCatalog]:
+    """
+    The compiled catalog at `path`, mapped once per process.
+
+    ### Returns:
+        `MappedCatalog`: The catalog, or `None` if it's missing, corrupted or out of date.
+    """
+    key = os.fspath(DEFAULT_PATH if path == None else path)
+
+    with _loadLock:
+        if key not in _loaded:
+            try:
+                _loaded[key] = MappedCatalog(key)
+            except (OSError, ValueError, struct.error):
+                _loaded[key] = None
+
+        return _loaded[key]
+
+
+def compile(path: typing.Union[str, os.PathLike] = None) -> str:
+    """
+    Compile the catalogs of `devices.py` into a binary catalog file.
+
+    ### Arguments:
+        path (`str`, default=`None`):
+            Where to write the catalog, default is `catalog.bin` next to this module.
+
+    ### Returns:
+        `str`: Path of the compiled catalog.
+    """
+    from . import devices
+
+    tables: typing.List[typing.Tuple[str, int, int, bytes]] = []
+
+    def addStrings(name: str, items: typing.Iterable[str]) -> None:
+        encoded = [item.encode("utf-8") for item in items]
+        offsets = [0]
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+
+        data = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+        tables.append((name, KIND_STRINGS, len(encoded), data))
+
+    for platform, system in devices.platforms.items():
+
+        # build from the literals on a throwaway subclass, never from a previous catalog
+        fresh = type(system.__name__, (system,), {"deviceList": []})
+        fresh.__gen__()
+
+        layout = []
+        for index, segment in enumerate(fresh.deviceList.segments):  # type: ignore
+            build = devices.DeviceSpace.buildName(segment.build)
+            layout.append(f"{build}:{len(segment.dimensions)}")
+            for dimension, values in enumerate(segment.dimensions):
+                addStrings(f"{platform}/{index}/{dimension}", values)
+
+        addStrings(f"layout/{platform}", layout)
+
+    lookups: typing.Dict[str, typing.Dict[str, int]] = {
+        "keys": {},
+        "manufacturers": {},
+        "names": {},
+        "types": {},
+    }
+
+    def lookup(table: str, value: str) -> int:
+        return lookups[table].setdefault(value, len(lookups[table]))
+
+    records = b"".join(
+        DESKTOP_RECORD.pack(
+            lookup("keys", key),
+            lookup("manufacturers", info["manufacturer"]),
+            lookup("names", info["model"]),
+            info["year"],
+            lookup("types", info["type"]),
+        )
+        for key, info in devices.GeneralDesktopDevice.device_models.items()
+    )
+    tables.append(
+        ("desktop/records", KIND_RECORDS, len(records) // DESKTOP_RECORD.size, records)
+    )
+    for table, values in lookups.items():
+        addStrings(f"desktop/{table}", values)
+
+    offset = HEADER.size + DIRECTORY_ENTRY.size * len(tables)
+    directory = b""
+    body = b""
+    for name, kind, count, data in tables:
+        directory += DIRECTORY_ENTRY.pack(name.encode("utf-8"), kind, count, offset + len(body))
+        body += data
+
+    path = os.fspath(DEFAULT_PATH if path == None else path)
+    temp = path + ".tmp"
+    with open(temp, "wb") as file:
+        file.write(
+            HEADER.pack(MAGIC, FORMAT_VERSION, source_digest(), len(tables))
+            + directory
+            + body
+        )
+
+    # replace atomically, processes that already mapped the old file keep using it
+    os.replace(temp, path)
+    return path
+
+
+if __name__ == "__main__":
+    print(compile(*sys.argv[1:2]))
@@ -0,0 +1,442 @@
+"""
+Android device models and SDK versions of `AndroidDevice`, loaded by `devices.py` on first use.
+"""
+from typing import List
+
+device_models: List[str] = [
+    "Samsung SM-A515F",
+    "Samsung SM-A515U",
+    "Samsung SM-A515U1",
+    "Samsung SM-A515W",
+    "Samsung SM-S515DL",
+    "Samsung SM-A715F",
+    "Samsung SM-A715W",
+    "Samsung SM-G980F",
+    "Samsung SM-G9810",
+    "Samsung SM-G981N",
+    "Samsung SM-G981U",
+    "Samsung SM-G981U1",
+    "Samsung SM-G981V",
+    "Samsung SM-G981W",
+    "Samsung SM-G981B",
+    "Samsung SM-G985F",
+    "Samsung SM-G9860",
+    "Samsung SM-G986N",
+    "Samsung SM-G986U",
+    "Samsung SM-G986U1",
+    "Samsung SM-G986W",
+    "Samsung SM-G986B",
+    "Samsung SM-G9880",
+    "Samsung SM-G988N",
+    "Samsung SM-G988Q",
+    "Samsung SM-G988U",
+    "Samsung SM-G988U1",
+    "Samsung SM-G988W",
+    "Samsung SM-G988B",
+    "Samsung SM-N980F",
+    "Samsung SM-N9810",
+    "Samsung SM-N981N",
+    "Samsung SM-N981U",
+    "Samsung SM-N981U1",
+    "Samsung SM-N981W",
+    "Samsung SM-N981B",
+    "Samsung SM-N985F",
+    "Samsung SM-N9860",
+    "Samsung SM-N986N",
+    "Samsung SM-N986U",
+    "Samsung SM-N986U1",
+    "Samsung SM-N986W",
+    "Samsung SM-N986B",
+    "Samsung SC-51B",
+    "Samsung SCG09",
+    "Samsung SM-G9910",
+    "Samsung SM-G991U1",
+    "Samsung SM-G991W",
+    "Samsung SM-G991B",
+    "Samsung SM-G991N",
+    "Samsung SCG10",
+    "Samsung SM-G9960",
+    "Samsung SM-G996U1",
+    "Samsung SM-G996W",
+    "Samsung SM-G996B",
+    "Samsung SM-G996N",
+    "Samsung SC-52B",
+    "Samsung SM-G9980",
+    "Samsung SM-G998U",
+    "Samsung SM-G998U1",
+    "Samsung SM-G998W",
+    "Samsung SM-G998B",
+    "Samsung SM-G998N",
+    "Samsung SM-A325F",
+    "Samsung SM-A325M",
+    "Samsung SCG08",
+    "Samsung SM-A326B",
+    "Samsung SM-A326BR",
+    "Samsung SM-A326U",
+    "Samsung SM-A326U1",
+    "Samsung SM-A326W",
+    "Samsung SM-S326DL",
+    "Samsung SM-A326K",
+    "Samsung SM-A4260",
+    "Samsung SM-A426B",
+    "Samsung SM-A426N",
+    "Samsung SM-A426U",
+    "Samsung SM-A426U1",
+    "Samsung SM-A525F",
+    "Samsung SM-A5260",
+    "Samsung SM-A526B",
+    "Samsung SM-A526N",
+    "Samsung SM-A526U",
+    "Samsung SM-A526U1",
+    "Samsung SM-A526W",
+    "Samsung SM-A725F",
+    "Samsung SM-A725M",
+    "Samsung SM-M127F",
+    "Samsung SM-M127G",
+    "Samsung SM-M127N",
+    "Samsung SM-F127G",
+    "Samsung SM-M426B",
+    "Samsung SM-M515F",
+    "Samsung SM-M625F",
+    "Samsung SM-F415F",
+    "Samsung SM-T870",
+    "Samsung SM-T875",
+    "Samsung SM-T875N",
+    "Samsung SM-T878U",
+    "Samsung SM-T970",
+    "Samsung SM-T975",
+    "Samsung SM-T975N",
+    "Samsung SM-T976B",
+    "Samsung SM-T976N",
+    "Samsung SM-T978U",
+    "Samsung SM-T730",
+    "Samsung SM-T735",
+    "Samsung SM-T735C",
+    "Samsung SM-T735N",
+    "Samsung SM-T736B",
+    "Samsung SM-T736N",
+    "Samsung SM-T737",
+    "Samsung SM-T220",
+    "Samsung SM-T225",
+    "Samsung SM-T225C",
+    "Samsung SM-T225N",
+    "Samsung SM-T500",
+    "Samsung SM-T505",
+    "Samsung SM-T505C",
+    "Samsung SM-T505N",
+    "Samsung SM-T507",
+    "Samsung SC-03L",
+    "Samsung SCV41",
+    "Samsung SM-G970F",
+    "Samsung SM-G970N",
+    "Samsung SM-G9700",
+    "Samsung SM-G9708",
+    "Samsung SM-G970U",
+    "Samsung SM-G970U1",
+    "Samsung SM-G970W",
+    "Samsung SM-G973F",
+    "Samsung SM-G973N",
+    "Samsung SM-G9730",
+    "Samsung SM-G9738",
+    "Samsung SM-G973C",
+    "Samsung SM-G973U",
+    "Samsung SM-G973U1",
+    "Samsung SM-G973W",
+    "Samsung SC-04L",
+    "Samsung SCV42",
+    "Samsung SM-G975F",
+    "Samsung SM-G975N",
+    "Samsung SM-G9750",
+    "Samsung SM-G9758",
+    "Samsung SM-G975U",
+    "Samsung SM-G975U1",
+    "Samsung SM-G975W",
+    "Samsung SM-G977B",
+    "Samsung SM-G977N",
+    "Samsung SM-G977P",
+    "Samsung SM-G977T",
+    "Samsung SM-G977U",
+    "Samsung SM-N970F",
+    "Samsung SM-N9700",
+    "Samsung SM-N970U",
+    "Samsung SM-N970U1",
+    "Samsung SM-N970W",
+    "Samsung SM-N971N",
+    "Samsung SC-01M",
+    "Samsung SCV45",
+    "Samsung SM-N9750",
+    "Samsung SM-N975C",
+    "Samsung SM-N975U",
+    "Samsung SM-N975U1",
+    "Samsung SM-N975W",
+    "Samsung SM-N975F",
+    "Samsung SM-N976B",
+    "Samsung SM-N976N",
+    "Samsung SM-N9760",
+    "Samsung SM-N976Q",
+    "Samsung SM-N976V",
+    "Samsung SM-N976U",
+    "Samsung SM-A015A",
+    "Samsung SM-A015AZ",
+    "Samsung SM-A015F",
+    "Samsung SM-A015G",
+    "Samsung SM-A015M",
+    "Samsung SM-A015T1",
+    "Samsung SM-A015U",
+    "Samsung SM-A015U1",
+    "Samsung SM-A015V",
+    "Samsung SM-S111DL",
+    "Samsung SM-A025A",
+    "Samsung SM-A025AZ",
+    "Samsung SM-A025F",
+    "Samsung SM-A025G",
+    "Samsung SM-A025M",
+    "Samsung SM-A025U",
+    "Samsung SM-A025U1",
+    "Samsung SM-A025V",
+    "Samsung SM-A115A",
+    "Samsung SM-A115AP",
+    "Samsung SM-A115AZ",
+    "Samsung SM-A115F",
+    "Samsung SM-A115M",
+    "Samsung SM-A115U",
+    "Samsung SM-A115U1",
+    "Samsung SM-A115W",
+    "Samsung SM-A125F",
+    "Samsung SM-A125M",
+    "Samsung SM-A125N",
+    "Samsung SM-A125U",
+    "Samsung SM-A125U1",
+    "Samsung SM-S127DL",
+    "Samsung SM-A217F",
+    "Samsung SM-A217M",
+    "Samsung SM-A217N",
+    "Samsung SM-A315F",
+    "Samsung SM-A315G",
+    "Samsung SM-A315N",
+    "Samsung SC-41A",
+    "Samsung SCV48",
+    "Samsung SM-A415F",
+    "Samsung SCV44",
+    "Samsung SM-F9000",
+    "Samsung SM-F900F",
+    "Samsung SM-F900U",
+    "Samsung SM-F900U1",
+    "Samsung SM-F900W",
+    "Samsung SCV47",
+    "Samsung SM-F7000",
+    "Samsung SM-F700F",
+    "Samsung SM-F700N",
+    "Samsung SM-F700U",
+    "Samsung SM-F700U1",
+    "Samsung SM-F700W",
+    "Samsung SCG04",
+    "Samsung SM-F9160",
+    "Samsung SM-F916B",
+    "Samsung SM-F916N",
+    "Samsung SM-F916Q",
+    "Samsung SM-F916U",
+    "Samsung SM-F916U1",
+    "Samsung SM-F916W",
+    "Samsung SM-T860",
+    "Samsung SM-T865",
+    "Samsung SM-T865N",
+    "Samsung SM-T866N",
+    "Samsung SM-T867",
+    "Samsung SM-T867R4",
+    "Samsung SM-T867U",
+    "Samsung SM-T867V",
+    "Samsung SM-P610",
+    "Samsung SM-P615",
+    "Samsung SM-P615C",
+    "Samsung SM-P615N",
+    "Samsung SM-P617",
+    "Samsung SM-T510",
+    "Samsung SM-T515",
+    "Samsung SM-T515N",
+    "Samsung SM-T517",
+    "Samsung SM-T517P",
+    "Samsung SM-T307U",
+    "Samsung SM-T570",
+    "Samsung SM-T575",
+    "Samsung SM-T575N",
+    "Samsung SM-T577",
+    "Samsung SM-T577U",
+    # Android 14 & 15
+    "Google Pixel 6",
+    "Google Pixel 6 Pro",
+    "Google Pixel 6a",
+    "Google Pixel 7",
+    "Google Pixel 7 Pro",
+    "Google Pixel 7a",
+    "Google Pixel 8",
+    "Google Pixel 8 Pro",
+    "Google Pixel 8a",
+    "Google Pixel 9",
+    "Google Pixel 9 Pro",
+    "Google Pixel 9 Pro XL",
+    "Google Pixel 9 Pro Fold",
+    "Google Pixel Fold",
+    "Google Pixel Tablet",
+    "Samsung Galaxy S24",
+    "Samsung Galaxy S24+",
+    "Samsung Galaxy S24 Ultra",
+    "Samsung Galaxy S24 FE",
+    "Samsung Galaxy S23",
+    "Samsung Galaxy S23+",
+    "Samsung Galaxy S23 Ultra",
+    "Samsung Galaxy S23 FE",
+    "Samsung Galaxy S22",
+    "Samsung Galaxy S22+",
+    "Samsung Galaxy S22 Ultra",
+    "Samsung Galaxy S21",
+    "Samsung Galaxy S21+",
+    "Samsung Galaxy S21 Ultra",
+    "Samsung Galaxy S21 FE",
+    "Samsung Galaxy Z Fold6",
+    "Samsung Galaxy Z Flip6",
+    "Samsung Galaxy Z Fold5",
+    "Samsung Galaxy Z Flip5",
+    "Samsung Galaxy Z Fold4",
+    "Samsung Galaxy Z Flip4",
+    "Samsung Galaxy Z Fold3",
+    "Samsung Galaxy Z Flip3",
+    "Samsung Galaxy A15",
+    "Samsung Galaxy A16",
+    "Samsung Galaxy A25",
+    "Samsung Galaxy A34",
+    "Samsung Galaxy A35",
+    "Samsung Galaxy A54",
+    "Samsung Galaxy A55",
+    "Samsung Galaxy A73",
+    "Samsung Galaxy F15",
+    "Samsung Galaxy F34",
+    "Samsung Galaxy F54",
+    "Samsung Galaxy F55",
+    "Samsung Galaxy M15",
+    "Samsung Galaxy M34",
+    "Samsung Galaxy M54",
+    "Samsung Galaxy M55",
+    "Samsung Galaxy Tab S9",
+    "Samsung Galaxy Tab S9+",
+    "Samsung Galaxy Tab S9 Ultra",
+    "Samsung Galaxy Tab S9 FE",
+    "Samsung Galaxy Tab S9 FE+",
+    "Samsung Galaxy Tab S8",
+    "Samsung Galaxy Tab S8+",
+    "Samsung Galaxy Tab S8 Ultra",
+    "Xiaomi 15",
+    "Xiaomi 14",
+    "Xiaomi 14T Pro",
+    "Xiaomi 13",
+    "Xiaomi 13T",
+    "Xiaomi 12",
+    "Xiaomi 12T",
+    "Xiaomi Civi 1S",
+    "Xiaomi Civi 2",
+    "Xiaomi Civi 3",
+    "Xiaomi Civi 4 Pro",
+    "Xiaomi Pad 6",
+    "Xiaomi Pad 6 Pro",
+    "Xiaomi Pad 6 Max 14",
+    "Xiaomi Pad 6S Pro 12.4",
+    "Xiaomi Pad 5 Pro 12.4",
+    "Redmi Note 13",
+    "Redmi Note 13 5G",
+    "Redmi Note 13 Pro",
+    "Redmi Note 13 Pro 5G",
+    "Redmi Note 13 Pro Plus 5G",
+    "Redmi Note 13R",
+    "Redmi Note 13R Pro",
+    "Redmi Note 12",
+    "Redmi Note 12 4G",
+    "Redmi Note 12 Turbo",
+    "Redmi Note 12 Pro 4G",
+    "Redmi Note 12 Pro Speed",
+    "Redmi Note 12R",
+    "Redmi Note 12R Pro",
+    "Redmi Note 12T Pro",
+    "Redmi Note 12S",
+    "Redmi K70",
+    "Redmi K70E",
+    "Redmi K70 Pro",
+    "Redmi K70 Ultra",
+    "Redmi K60",
+    "Redmi K60 Pro",
+    "Redmi K60 Ultra",
+    "Redmi 14C",
+    "Redmi 13",
+    "Redmi 13R",
+    "Redmi 13 5G",
+    "Redmi 13C 5G",
+    "Redmi Pad Pro",
+    "OnePlus 13",
+    "OnePlus 13R",
+    "OnePlus 12",
+    "OnePlus 12R",
+    "OnePlus 11",
+    "OnePlus 11R",
+    "OnePlus 10 Pro",
+    "OnePlus 10T",
+    "OnePlus 10R",
+    "OnePlus Open",
+    "OnePlus Nord 3",
+    "OnePlus Nord 4",
+    "OnePlus Nord CE3",
+    "OnePlus Nord CE3 Lite",
+    "OnePlus Nord CE4",
+    "OnePlus Nord CE4 Lite",
+    "OnePlus Pad",
+    "OnePlus Pad 2",
+    "Sony Xperia 1 VI",
+    "Sony Xperia 1 V",
+    "Sony Xperia 5 V",
+    "Sony Xperia 10 VI",
+    "Sony Xperia 10 V",
+    "Asus ROG Phone 8",
+    "Asus ROG Phone 8 Pro",
+    "Asus ROG Phone 7",
+    "Motorola Razr+ (2024)",
+    "Motorola Razr 50 Ultra",
+    "Motorola Razr (2024)",
+    "Motorola Razr 50",
+    "Motorola Razr 50s",
+    "Motorola Razr+ (2023)",
+    "Motorola Razr 40 Ultra",
+    "Motorola Razr (2023)",
+    "Motorola Razr 40",
+    "Motorola Razr 40s",
+    "Motorola Edge (2024)",
+    "Motorola Edge (2023)",
+    "Motorola Edge+ (2023)",
+    "Motorola Edge 50 Ultra",
+    "Motorola Edge 50 Pro",
+    "Motorola Edge 50 Neo",
+    "Motorola Edge 50 Fusion",
+    "Motorola Edge 50",
+    "Motorola Edge 40",
+    "Motorola Edge 40 Neo",
+    "Motorola Edge 40 Pro",
+    "Motorola Edge 30 Ultra",
+    "Motorola Moto G Power 5G (2024)",
+    "Motorola Moto G Stylus 5G (2024)",
+    "Motorola Moto G 5G (2024)",
+    "Motorola Moto G85",
+    "Motorola Moto G75",
+    "Motorola Moto G55",
+    "Motorola Moto G45",
+    "Motorola Moto G35",
+    "Motorola Moto G34 5G",
+    "Motorola ThinkPhone",
+    "Realme C55",
+    "Realme GT series",
+]
+
+system_versions: List[str] = [
+    "SDK 31",  # Android 12 (2021)
+    "SDK 32",  # Android 12L (2021)
+    "SDK 33",  # Android 13 Tiramisu (2022)
+    "SDK 34",  # Android 14 Upside Down Cake (2023)
+    "SDK 35",  # Android 15 Vanilla Ice Cream (2024)
+    # "SDK 36",  # Android 16 Baklava (2025)
+]
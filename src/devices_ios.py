@@ -0,0 +1,69 @@
+"""
+iPhone models and iOS versions of `iOSDeivce`, loaded by `devices.py` on first use.
+"""
+from typing import Dict, List
+
+device_models: Dict[int, List[str]] = {
+    11: ["", " Pro", " Pro Max"],
+    12: [" mini", "", " Pro", " Pro Max"],
+    13: [" Pro", " Pro Max", " Mini", ""],
+    14: [" Pro", " Pro Max", " Plus", ""],
+    15: [" Pro", " Pro Max", " Plus", ""],
+    16: [" Pro", " Pro Max", " Plus", "e", ""],
+}
+
+system_versions: Dict[int, Dict[int, List[int]]] = {
+    # Версии обновлены 05.08.2025
+
+    # iOS 26 (сентябрь 2025 - планируемый релиз) пока исключаем
+    # Новая система нумерации на основе года
+    # 26: {
+    #     0: [],  # iOS 26.0 (планируется к релизу в сентябре 2025)
+    # },
+
+    # iOS 18 (сентябрь 2024 - текущая актуальная версия)
+    18: {
+        6: [],  # iOS 18.6 (июль 2025) - текущая версия
+        5: [],  # iOS 18.5 (май 2025)
+        4: [1],  # iOS 18.4.1 (апрель 2025)
+        3: [2, 1],  # iOS 18.3.1, 18.3.2 (февраль-март 2025)
+        2: [1],  # iOS 18.2.1 (январь 2025)
+        1: [1],  # iOS 18.1.1 (ноябрь 2024)
+        0: [1],  # iOS 18.0.1 (октябрь 2024)
+    },
+
+    # iOS 17 (сентябрь 2023)
+    17: {
+        7: [2],  # iOS 17.7.2 (ноябрь 2024)
+        6: [1],  # iOS 17.6.1 (август 2024)
+        5: [],  # iOS 17.5 (май 2024)
+        4: [1],  # iOS 17.4.1 (март 2024)
+        3: [1],  # iOS 17.3.1 (февраль 2024)
+        2: [1],  # iOS 17.2.1 (декабрь 2023)
+        1: [2, 1],  # iOS 17.1.1, 17.1.2 (октябрь-ноябрь 2023)
+        0: [3, 2, 1],  # iOS 17.0.1, 17.0.2, 17.0.3 (сентябрь-октябрь 2023)
+    },
+
+    # iOS 16 (сентябрь 2022)
+    16: {
+        7: [11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1],  # iOS 16.7.1 - 16.7.11 (сентябрь 2023 - март 2025)
+        6: [1],  # iOS 16.6.1 (сентябрь 2023)
+        5: [1],  # iOS 16.5.1 (май 2023)
+        4: [1],  # iOS 16.4.1 (апрель 2023) + RSR патч
+        3: [1],  # iOS 16.3.1 (февраль 2023)
+        2: [],  # iOS 16.2 (декабрь 2022)
+        1: [2, 1],  # iOS 16.1.1, 16.1.2 (октябрь-ноябрь 2022)
+        0: [3, 2, 1],  # iOS 16.0.1, 16.0.2, 16.0.3 (сентябрь-октябрь 2022)
+    },
+    15: {
+        8: [4, 3, 2, 1],  # iOS 15.8.1 - 15.8.4 (включая март 2025)
+        7: [9, 8, 7, 6, 5, 4, 3, 2, 1],  # iOS 15.7.1 - 15.7.9
+        6: [1],  # iOS 15.6.1
+        5: [],  # iOS 15.5
+        4: [1],  # iOS 15.4.1
+        3: [1],  # iOS 15.3.1
+        2: [],  # iOS 15.2
+        1: [1],  # iOS 15.1.1
+        0: [2, 1],  # iOS 15.0.1, 15.0.2
+    },
+}
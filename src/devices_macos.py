@@ -0,0 +1,164 @@
+"""
+Mac device models and macOS versions of `macOSDevice`, loaded by `devices.py` on first use.
+"""
+from typing import List
+
+# Total: 54 device models, update Jan 10th 2022
+# Only list device models since 2013
+#
+# Sources:
+# Thanks to: https://mrmacintosh.com/list-of-mac-boardid-deviceid-model-identifiers-machine-models/
+#       and: https://github.com/brunerd/jamfTools/blob/main/EAs/macOSCompatibility.sh
+#
+# Remark: https://www.innerfence.com/howto/apple-ios-devices-dates-versions-instruction-sets
+# Added 12+ MacOS versions: https://apple.fandom.com/wiki/List_of_Mac_OS_versions
+
+device_models: List[str] = [
+    "iMac20,1",  # iMac (Retina 5K, 27-inch, 2020)	4 августа 2020 г.
+    "iMac20,2",  # iMac (Retina 5K, 27-inch, 2020)	4 августа 2020 г.
+    "iMac21,1",  # iMac (24-inch, M1, 2021)	20 апреля 2021 г.
+    "iMac21,2",  # iMac (24-inch, M1, 2021)	20 апреля 2021 г.
+    "MacBookAir9,1",  # MacBook Air (Retina, 13-inch, 2020)	18 марта 2020 г.
+    "MacBookAir10,1",  # MacBook Air (M1, 2020)	10 ноября 2020 г.
+    "MacBookPro16,2",  # MacBook Pro (13-inch, 2020, 4 TBT3)	4 мая 2020 г.
+    "MacBookPro16,3",  # MacBook Pro (13-inch, 2020, 2 TBT3)	4 мая 2020 г.
+    "MacBookPro17,1",  # MacBook Pro (13-inch, M1, 2020)	10 ноября 2020 г.
+    "MacBookPro18,1",  # MacBook Pro (16-inch, 2021)	18 октября 2021 г.
+    "MacBookPro18,2",  # MacBook Pro (16-inch, 2021)	18 октября 2021 г.
+    "MacBookPro18,3",  # MacBook Pro (14-inch, 2021)	18 октября 2021 г.
+    "MacBookPro18,4",  # MacBook Pro (14-inch, 2021)	18 октября 2021 г.
+    "Macmini9,1",  # Mac mini (M1, 2020)	10 ноября 2020 г.
+    "Mac13,1",  # Mac Studio (2022)	8 марта 2022 г.
+    "Mac13,2",  # Mac Studio (2022)	8 марта 2022 г.
+    "Mac14,2",  # MacBook Air (M2, 2022)	6 июня 2022 г.
+    "Mac14,3",  # Mac mini (2023)	17 января 2023 г.
+    "Mac14,5",  # MacBook Pro (14-inch, 2023)	17 января 2023 г.
+    "Mac14,6",  # MacBook Pro (16-inch, 2023)	17 января 2023 г.
+    "Mac14,7",  # MacBook Pro (13-inch, M2, 2022)	6 июня 2022 г.
+    "Mac14,8",  # Mac Pro (2023)	5 июня 2023 г.
+    "Mac14,9",  # MacBook Pro (14-inch, 2023)	17 января 2023 г.
+    "Mac14,10",  # MacBook Pro (16-inch, 2023)	17 января 2023 г.
+    "Mac14,12",  # Mac mini (2023)	17 января 2023 г.
+    "Mac14,13",  # Mac Studio (2023)	5 июня 2023 г.
+    "Mac14,14",  # Mac Studio (2023)	5 июня 2023 г.
+    "Mac14,15",  # MacBook Air (15-inch, M2, 2023)	5 июня 2023 г.
+    "Mac15,3",  # MacBook Pro (14-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,4",  # iMac (24-inch, 2023)	30 октября 2023 г.
+    "Mac15,5",  # iMac (24-inch, 2023)	30 октября 2023 г.
+    "Mac15,6",  # MacBook Pro (14-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,7",  # MacBook Pro (16-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,8",  # MacBook Pro (14-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,9",  # MacBook Pro (16-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,10",  # MacBook Pro (14-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,11",  # MacBook Pro (16-inch, Nov 2023)	30 октября 2023 г.
+    "Mac15,12",  # MacBook Air (13-inch, M3, 2024)	4 марта 2024 г.
+    "Mac15,13",  # MacBook Air (15-inch, M3, 2024)	4 марта 2024 г.
+    "Mac16,1",  # MacBook Pro (14-inch, 2024)	30 октября 2024 г.
+    "Mac16,2",  # iMac (24-inch, 2024)	28 октября 2024 г.
+    "Mac16,3",  # iMac (24-inch, 2024)	28 октября 2024 г.
+    "Mac16,5",  # MacBook Pro (16-inch, 2024)	30 октября 2024 г.
+    "Mac16,6",  # MacBook Pro (14-inch, 2024)	30 октября 2024 г.
+    "Mac16,7",  # MacBook Pro (16-inch, 2024)	30 октября 2024 г.
+    "Mac16,8",  # MacBook Pro (14-inch, 2024)	30 октября 2024 г.
+]
+
+# Source: https://support.apple.com/en-us/HT201222
+system_versions: List[str] = [
+    "macOS 11.0",
+    "macOS 11.0.1",
+    "macOS 11.1",
+    "macOS 11.2",
+    "macOS 11.2.1",
+    "macOS 11.2.2",
+    "macOS 11.2.3",
+    "macOS 11.3",
+    "macOS 11.3.1",
+    "macOS 11.4",
+    "macOS 11.5",
+    "macOS 11.5.1",
+    "macOS 11.5.2",
+    "macOS 11.6",
+    "macOS 11.6.1",
+    "macOS 11.6.2",
+    "macOS 12.0",
+    "macOS 12.0.1",
+    "macOS 12.1",
+    "macOS 12.2",
+    "macOS 12.2.1",
+    "macOS 12.3",
+    "macOS 12.3.1",
+    "macOS 12.4",
+    "macOS 12.5",
+    "macOS 12.5.1",
+    "macOS 12.6",
+    "macOS 12.6.1",
+    "macOS 12.6.2",
+    "macOS 12.6.3",
+    "macOS 12.6.4",
+    "macOS 12.6.5",
+    "macOS 12.6.6",
+    "macOS 12.6.7",
+    "macOS 12.6.8",
+    "macOS 12.6.9",
+    "macOS 12.7",
+    "macOS 12.7.1",
+    "macOS 12.7.2",
+    "macOS 12.7.3",
+    "macOS 12.7.4",
+    "macOS 12.7.5",
+    "macOS 12.7.6",
+    "macOS 13.0",
+    "macOS 13.0.1",
+    "macOS 13.1",
+    "macOS 13.2",
+    "macOS 13.2.1",
+    "macOS 13.3",
+    "macOS 13.3.1",
+    "macOS 13.4",
+    "macOS 13.4.1",
+    "macOS 13.5",
+    "macOS 13.5.1",
+    "macOS 13.5.2",
+    "macOS 13.6",
+    "macOS 13.6.1",
+    "macOS 13.6.2",
+    "macOS 13.6.3",
+    "macOS 13.6.4",
+    "macOS 13.6.5",
+    "macOS 13.6.6",
+    "macOS 13.6.7",
+    "macOS 13.6.8",
+    "macOS 13.6.9",
+    "macOS 13.7",
+    "macOS 13.7.1",
+    "macOS 13.7.2",
+    "macOS 13.7.3",
+    "macOS 13.7.4",
+    "macOS 14.0",
+    "macOS 14.1",
+    "macOS 14.1.1",
+    "macOS 14.1.2",
+    "macOS 14.2",
+    "macOS 14.2.1",
+    "macOS 14.3",
+    "macOS 14.3.1",
+    "macOS 14.4",
+    "macOS 14.4.1",
+    "macOS 14.5",
+    "macOS 14.6",
+    "macOS 14.6.1",
+    "macOS 14.7",
+    "macOS 14.7.1",
+    "macOS 14.7.2",
+    "macOS 14.7.3",
+    "macOS 14.7.4",
+    "macOS 15.0",
+    "macOS 15.0.1",
+    "macOS 15.1",
+    "macOS 15.1.1",
+    "macOS 15.2",
+    "macOS 15.3",
+    "macOS 15.3.1",
+    "macOS 15.4",
+    "macOS 15.5",
+]
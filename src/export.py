@@ -0,0 +1,367 @@
+"""
+Streaming export of generated APIs to JSON Lines, CSV and a fixed-width binary format.
+
+Every record holds the content fields of an `APIData` and the `unique_id` it was generated
+from, `None` if there's none. Writers write one record at a time and readers read one record
+at a time, so neither ever holds the whole fleet.
+
+### Examples:
+```python
+    with export.writer("fleet.jsonl") as output:
+        for unique_id in unique_ids:
+            output.write(API.TelegramAndroid.Generate(unique_id), unique_id)
+
+    for unique_id, api in export.read("fleet.jsonl"):
+        ...
+```
+"""
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import os
+import struct
+import typing
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+
+from .api import APIData, CONTENT_FIELDS
+
+_T = TypeVar("_T")
+
+PathOrFile = typing.Union[str, os.PathLike, typing.IO]
+
+FIELDS = ("unique_id",) + CONTENT_FIELDS
+STRING_FIELDS = tuple(x for x in FIELDS if x != "api_id")
+
+
+def record(api: APIData, unique_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    The record of `api`, as a dict of `FIELDS`.
+    """
+    result: Dict[str, Any] = {"unique_id": None if unique_id == None else str(unique_id)}
+    for field in CONTENT_FIELDS:
+        result[field] = getattr(api, field)
+    return result
+
+
+def fromRecord(data: Dict[str, Any], cls: Type[_T] = APIData) -> Tuple[Optional[str], _T]:
+    """
+    The `unique_id` and a new API of class `cls` with the content of a record.\
+    Fields that the record doesn't have get the defaults of `cls`, the others are kept as is.
+    """
+    # not cls(**fields), which would replace empty strings by the defaults of the class
+    api = cls.__new__(cls)
+    api._initData()  # type: ignore
+    api.__dict__.update({x: data[x] for x in CONTENT_FIELDS if x in data})
+    api._makePID()  # type: ignore
+    return data.get("unique_id"), api
+
+
+class Writer(object):
+    """
+    Base of the writers, works as a context manager.
+
+    ### Arguments:
+        file (`str` | `PathLike` | `IO`):
+            A path, or a file object opened by the caller, which won't be closed.
+    """
+
+    binary = False
+    file: typing.IO[Any]
+
+    def __init__(self, file: PathOrFile) -> None:
+        self.owned = _isPath(file)
+        if self.owned:
+            if self.binary:
+                self.file = open(os.fspath(file), "wb")  # type: ignore
+            else:
+                self.file = open(os.fspath(file), "w", encoding="utf-8", newline="")  # type: ignore
+        else:
+            self.file = file  # type: ignore
+        self.count = 0
+
+    def write(self, api: APIData, unique_id: Optional[str] = None) -> None:
+        self._writeRecord(record(api, unique_id))
+        self.count += 1
+
+    def writeMany(
+        self, apis: typing.Iterable[APIData], unique_ids: typing.Iterable[Optional[str]] = None
+    ) -> None:
+        """
+        Write every API of `apis`, with the unique ID at the same position of `unique_ids`.
+        """
+        if unique_ids == None:
+            for api in apis:
+                self.write(api)
+        else:
+            for api, unique_id in zip(apis, unique_ids):
+                self.write(api, unique_id)
+
+    def _writeRecord(self, data: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class JsonLinesWriter(Writer):
+    """
+    One JSON object per line, with the fields in the order of `FIELDS`.
+    """
+
+    def _writeRecord(self, data: Dict[str, Any]) -> None:
+        self.file.write(json.dumps(data, ensure_ascii=False))
+        self.file.write("\n")
+
+
+class CsvWriter(Writer):
+    """
+    A header with `FIELDS`, then one row per API.\\
+    `None` and empty strings are both written as an empty cell. An empty `unique_id` or `api_id`
+    is read back as `None`, any other empty field as an empty string.
+    """
+
+    def __init__(self, file: PathOrFile) -> None:
+        super().__init__(file)
+        self.csv = csv.writer(self.file, lineterminator="\n")
+        self.csv.writerow(FIELDS)
+
+    def _writeRecord(self, data: Dict[str, Any]) -> None:
+        self.csv.writerow(["" if data[x] == None else data[x] for x in FIELDS])
+
+
+class BinaryWriter(Writer):
+    """
+    Fixed-width records, so that record `i` is at `header + i * size`, see `BinaryReader`.
+
+    The header is the magic `b"OTAPI"`, the format version and the width in bytes of every
+    string field. A record is `api_id` as a little-endian int64, then every string field as
+    a uint16 byte length (`0xFFFF` for `None`) followed by its utf-8 bytes, zero padded.
+
+    ### Arguments:
+        widths (`Dict[str, int]`, default=`None`):
+            Width of the string fields that don't fit in `BinaryWriter.widths`.
+
+    ### Raises:
+        `ValueError`: A field is longer than its width.
+    """
+
+    binary = True
+    magic = b"OTAPI"
+    version = 1
+    widths = {
+        "unique_id": 64,
+        "api_hash": 32,
+        "device_model": 128,
+        "system_version": 64,
+        "app_version": 32,
+        "lang_code": 16,
+        "system_lang_code": 16,
+        "lang_pack": 16,
+    }
+
+    def __init__(
+        self, file: PathOrFile, widths: Dict[str, int] = None
+    ) -> None:
+        super().__init__(file)
+        self.widths = dict(BinaryWriter.widths, **(widths or {}))
+        if any(not 0 <= x < 0xFFFF for x in self.widths.values()):
+            raise ValueError("Field widths must be below 65535 bytes")
+
+        self.struct = _recordStruct([self.widths[x] for x in STRING_FIELDS])
+        self.file.write(_header(self.version, [self.widths[x] for x in STRING_FIELDS]))
+
+    def _writeRecord(self, data: Dict[str, Any]) -> None:
+        values: List[Any] = [-1 if data["api_id"] == None else data["api_id"]]
+        for field in STRING_FIELDS:
+            if data[field] == None:
+                values += [0xFFFF, b""]
+                continue
+
+            value = str(data[field]).encode("utf-8")
+            if len(value) > self.widths[field]:
+                raise ValueError(
+                    f"{field} is {len(value)} bytes, longer than its width of {self.widths[field]}"
+                )
+            values += [len(value), value]
+
+        self.file.write(self.struct.pack(*values))
+
+
+def _header(version: int, widths: List[int]) -> bytes:
+    return struct.pack(f"<5sBB{len(widths)}H", BinaryWriter.magic, version, len(widths), *widths)
+
+
+def _recordStruct(widths: List[int]) -> struct.Struct:
+    return struct.Struct("<q" + "".join(f"H{width}s" for width in widths))
+
+
+def readJsonLines(
+    file: PathOrFile, cls: Type[_T] = APIData
+) -> Iterator[Tuple[Optional[str], _T]]:
+    """
+    The unique ID and the API of every record written by `JsonLinesWriter`.
+    """
+    with _opened(file) as lines:
+        for line in lines:
+            if line.strip():
+                yield fromRecord(json.loads(line), cls)
+
+
+def readCsv(
+    file: PathOrFile, cls: Type[_T] = APIData
+) -> Iterator[Tuple[Optional[str], _T]]:
+    """
+    The unique ID and the API of every row written by `CsvWriter`.
+    """
+    with _opened(file) as rows:
+        for row in csv.DictReader(rows):
+            data: Dict[str, Any] = {x: row[x] for x in FIELDS if x in row}
+            data["unique_id"] = row.get("unique_id") or None
+            if "api_id" in data:
+                data["api_id"] = int(data["api_id"]) if data["api_id"] else None
+            yield fromRecord(data, cls)
+
+
+class BinaryReader(object):
+    """
+    Records written by `BinaryWriter`, read sequentially or by their index.
+
+    ### Raises:
+        `ValueError`: Not a file written by `BinaryWriter`.
+
+    ### Examples:
+    ```python
+        with export.BinaryReader("fleet.bin") as fleet:
+            print(len(fleet))
+            unique_id, api = fleet[1000]
+    ```
+    """
+
+    def __init__(self, file: PathOrFile, cls: Type[APIData] = APIData) -> None:
+        self.owned = _isPath(file)
+        self.file: typing.IO[bytes] = open(os.fspath(file), "rb") if self.owned else file  # type: ignore
+        self.cls = cls
+
+        start = self.file.tell()
+        magic, version, count = struct.unpack("<5sBB", self.file.read(7))
+        if magic != BinaryWriter.magic or version != BinaryWriter.version:
+            raise ValueError("Not an opentele binary export, or a newer version of it")
+
+        widths = list(struct.unpack(f"<{count}H", self.file.read(2 * count)))
+        if count != len(STRING_FIELDS):
+            raise ValueError(f"Expected {len(STRING_FIELDS)} string fields, got {count}")
+
+        self.struct = _recordStruct(widths)
+        self.begin = start + 7 + 2 * count
+        self.file.seek(0, os.SEEK_END)
+        self.count = (self.file.tell() - self.begin) // self.struct.size
+        self.file.seek(self.begin)
+
+    def _fromBytes(self, data: bytes) -> Tuple[Optional[str], APIData]:
+        values = self.struct.unpack(data)
+        result: Dict[str, Any] = {"api_id": None if values[0] == -1 else values[0]}
+        for index, field in enumerate(STRING_FIELDS):
+            size, value = values[1 + 2 * index], values[2 + 2 * index]
+            result[field] = None if size == 0xFFFF else value[:size].decode("utf-8")
+        return fromRecord(result, self.cls)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Tuple[Optional[str], APIData]:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("BinaryReader index out of range")
+
+        self.file.seek(self.begin + index * self.struct.size)
+        return self._fromBytes(self.file.read(self.struct.size))
+
+    def __iter__(self) -> Iterator[Tuple[Optional[str], APIData]]:
+        for index in range(self.count):
+            yield self[index]
+
+    def close(self) -> None:
+        if self.owned:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def readBinary(
+    file: PathOrFile, cls: Type[APIData] = APIData
+) -> Iterator[Tuple[Optional[str], APIData]]:
+    """
+    The unique ID and the API of every record written by `BinaryWriter`.
+    """
+    with BinaryReader(file, cls) as records:
+        yield from records
+
+
+formats = {
+    "jsonl": (JsonLinesWriter, readJsonLines),
+    "csv": (CsvWriter, readCsv),
+    "bin": (BinaryWriter, readBinary),
+}
+
+
+def formatOf(path: typing.Union[str, os.PathLike], format: str = None) -> str:
+    """
+    `format` if it's set, else the format of the extension of `path`.
+
+    ### Raises:
+        `ValueError`: Unknown format.
+    """
+    if format == None:
+        format = os.path.splitext(os.fspath(path))[1].lstrip(".").lower()
+        format = "jsonl" if format in ("json", "ndjson") else format
+
+    if format not in formats:
+        raise ValueError(f"Unknown format {format!r}, expected one of {', '.join(formats)}")
+    return format
+
+
+def writer(file: PathOrFile, format: str = None) -> Writer:
+    """
+    A writer of `format`, default is the format of the extension of `file`.
+    """
+    if format == None and not _isPath(file):
+        raise ValueError("The format of a file object must be set")
+    return formats[formatOf(file if _isPath(file) else "", format)][0](file)  # type: ignore
+
+
+def read(
+    file: PathOrFile, format: str = None, cls: Type[APIData] = APIData
+) -> Iterator[Tuple[Optional[str], APIData]]:
+    """
+    The unique ID and the API of every record, default format is the extension of `file`.
+    """
+    if format == None and not _isPath(file):
+        raise ValueError("The format of a file object must be set")
+    return formats[formatOf(file if _isPath(file) else "", format)][1](file, cls)  # type: ignore
+
+
+def _isPath(file: PathOrFile) -> bool:
+    return isinstance(file, (str, os.PathLike))
+
+
+def _opened(file: PathOrFile) -> typing.ContextManager[typing.IO]:
+    # A path is opened and closed, a file object is used as is
+    if _isPath(file):
+        return open(os.fspath(file), "r", encoding="utf-8", newline="")  # type: ignore
+    return contextlib.nullcontext(file)  # type: ignore
@@ -0,0 +1,86 @@
+"""
+Hashing of unique IDs on a pool of processes, see `APIData.GenerateParallel()`.
+
+The unique IDs are split in shards of consecutive IDs. Each worker turns a shard into the
+compact indices of `APIData._indicesMany()`, which take 11 bytes per ID. `APIData` objects are
+never pickled. The shards come back in input order, so the result doesn't depend on the number
+of workers or on which of them finished first.
+"""
+from __future__ import annotations
+
+import array
+import itertools
+import os
+import typing
+from typing import Any, List, Optional, Tuple
+
+from .devices import SystemInfo
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+Indices = Tuple[array.array, array.array, array.array]
+
+
+def _shard(
+    cls: Any, unique_ids: List[Optional[str]], system: Optional[str], layer: Optional[int]
+) -> Indices:
+    return cls._indicesMany(SystemInfo._seedsMany(unique_ids), system, layer)
+
+
+def indicesMany(
+    cls: Any,
+    unique_ids: typing.Iterable[Optional[str]],
+    system: Optional[str] = None,
+    layer: int = None,
+    workers: int = None,
+    shard_size: int = 65536,
+    executor: concurrent.futures.Executor = None,
+) -> Indices:
+    """
+    `cls._indicesMany()` of every unique ID, computed by `workers` processes.\\
+    With an `executor`, the shards are mapped on it instead, and it's left running.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be at least 1")
+
+    unique_ids = list(unique_ids)
+    if workers == None:
+        workers = os.cpu_count() or 1
+
+    if (executor == None and workers <= 1) or len(unique_ids) <= shard_size:
+        return _shard(cls, unique_ids, system, layer)
+
+    shards = [
+        unique_ids[begin : begin + shard_size]
+        for begin in range(0, len(unique_ids), shard_size)
+    ]
+
+    if executor != None:
+        return _mapShards(executor, cls, shards, system, layer)
+
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(min(workers, len(shards))) as executor:
+        return _mapShards(executor, cls, shards, system, layer)
+
+
+def _mapShards(
+    executor: concurrent.futures.Executor,
+    cls: Any,
+    shards: List[List[Optional[str]]],
+    system: Optional[str],
+    layer: Optional[int],
+) -> Indices:
+    results: Indices = (array.array("B"), array.array("Q"), array.array("H"))
+    for indices in executor.map(
+        _shard,
+        itertools.repeat(cls),
+        shards,
+        itertools.repeat(system),
+        itertools.repeat(layer),
+    ):
+        for result, shard in zip(results, indices):
+            result.extend(shard)
+
+    return results
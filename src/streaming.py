@@ -0,0 +1,71 @@
+"""
+Generation of APIs in chunks from asyncio, see `APIData.GenerateStream()`.
+"""
+from __future__ import annotations
+
+import collections
+import itertools
+import typing
+from typing import Any, Callable, List, Optional
+
+# asyncio and concurrent.futures are only imported by a stream, they'd double the import time
+if typing.TYPE_CHECKING:
+    import asyncio
+    import concurrent.futures
+
+
+async def chunks(
+    generate: Callable[[List[Optional[str]]], List[Any]],
+    unique_ids: typing.Iterable[Optional[str]],
+    chunk_size: int = 1000,
+    prefetch: int = 1,
+    executor: concurrent.futures.Executor = None,
+) -> typing.AsyncIterator[List[Any]]:
+    """
+    Yield `generate(chunk)` for every chunk of `chunk_size` unique IDs, in order.
+
+    `generate` runs in `executor`, so that building the catalogs and hashing never block the
+    event loop. At most `prefetch` chunks are generated ahead of the consumer: the next chunks
+    are only started when the consumer asks for one, which is the only backpressure needed.
+
+    ### Arguments:
+        executor (`Executor`, default=`None`):
+            Where `generate` runs, default is a thread of this stream.
+            With an executor of several workers, chunks may be generated at the same time.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if prefetch < 0:
+        raise ValueError("prefetch can't be negative")
+
+    import asyncio
+    import concurrent.futures
+
+    loop = asyncio.get_running_loop()
+    owned = executor == None
+    if owned:
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+
+    iterator = iter(unique_ids)
+    pending: typing.Deque[asyncio.Future] = collections.deque()
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) <= prefetch:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if len(chunk) == 0:
+                    exhausted = True
+                else:
+                    pending.append(loop.run_in_executor(executor, generate, chunk))
+
+            if len(pending) == 0:
+                return
+
+            yield await pending.popleft()
+
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            executor.shutdown(wait=False)  # type: ignore
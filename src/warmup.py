@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import gc
+import typing
+
+from .devices import platforms as _platforms
+from .exception import *
+
+
+def preload(platforms: typing.Iterable[str] = None, freeze: bool = True) -> None:
+    """
+    Build the device catalogs right away instead of on their first use.
+
+    Catalogs are built lazily, so every worker of a pre-fork server would build its own copy
+    on its first `Generate()`. Call this in the parent process before forking, the workers then
+    share the already built catalogs with copy-on-write.
+
+    ### Arguments:
+        platforms (`Iterable[str]`, default=`None`):
+            Which catalogs to build, any of `"windows"`, `"macos"`, `"linux"`, `"android"` and `"ios"`.\\
+            Default is `None` - which means all of them.
+
+        freeze (`bool`, default=`True`):
+            Run a full garbage collection then move every object to the permanent generation
+            with `gc.freeze()`, so the garbage collector of the workers never writes to those pages.
+
+    ### Raises:
+        `OpenTeleException`: Unknown platform name.
+
+    ### Examples:
+    ```python
+        import opentele
+        opentele.preload()
+
+        # fork the workers here
+    ```
+    """
+    names = list(_platforms) if platforms == None else list(platforms)
+
+    for name in names:
+        Expects(
+            name in _platforms,
+            f"Unknown platform {name}, expected one of {list(_platforms)}",
+        )
+        _platforms[name].__gen__()
+
+    # the app version tables are otherwise imported by the first Generate() of every worker
+    from . import app_versions  # noqa: F401
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
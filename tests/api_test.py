@@ -0,0 +1,268 @@
+import os, sys, pathlib
+import pytest
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+base_dir = pathlib.Path(__file__).parent.parent.absolute().__str__()
+sys.path.insert(1, base_dir)
+
+from src.api import API, APIData, PIDRegistry
+from src.exception import OpenTeleException
+from src.devices import SystemInfo, FieldSeeds, LinuxDevice, WindowsDevice, DeviceFilter
+from src.app_versions import AppVersion, AppVersionTable
+
+
+def test_registry_lookup():
+
+    api = API.TelegramAndroid()
+
+    assert isinstance(APIData.CustomInitConnectionList, PIDRegistry)
+    assert APIData.findData(api.pid) is api
+    assert APIData.findData(API.TelegramIOS.pid) is API.TelegramIOS
+    assert APIData.findData(-1) == None
+
+    assert api in APIData.CustomInitConnectionList
+    assert API.TelegramDesktop in list(APIData.CustomInitConnectionList)
+    assert len(APIData.CustomInitConnectionList) >= 9
+
+
+def test_registry_unique_pids():
+
+    apis = [API.TelegramDesktop.Generate() for x in range(1000)]
+    assert len(set(api.pid for api in apis)) == len(apis)
+
+    for api in apis:
+        assert APIData.findData(api.pid) is api
+
+
+def test_registry_releases_instances():
+
+    api = API.TelegramAndroid.Generate()
+    pid = api.pid
+    del api
+    assert APIData.findData(pid) == None
+
+    api = API.TelegramAndroid.Generate()
+    pid = api.pid
+    api.destroy()
+    assert APIData.findData(pid) == None
+
+    # classes can't be destroyed
+    API.TelegramAndroid.destroy()
+    assert APIData.findData(API.TelegramAndroid.pid) is API.TelegramAndroid
+
+
+@pytest.mark.skipif(resource == None, reason="resource module is not available")
+def test_registry_memory_bounded():
+
+    # set OPENTELE_MEMORY_TEST_COUNT=1000000 for the full run, it takes minutes
+    count = int(os.environ.get("OPENTELE_MEMORY_TEST_COUNT", 50_000))
+
+    for x in range(10000):
+        API.TelegramDesktop.Generate(unique_id=x)
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    registered = len(APIData.CustomInitConnectionList)
+
+    for x in range(count):
+        API.TelegramDesktop.Generate(unique_id=x)
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+    if sys.platform == "darwin":
+        growth //= 1024
+
+    assert len(APIData.CustomInitConnectionList) <= registered + 1
+    assert growth < 32 * 1024
+
+
+def test_content_hash():
+
+    api = API.TelegramDesktop.Generate("windows", "opentele")
+    same = API.TelegramDesktop.Generate("windows", "opentele")
+    same.app_version = api.app_version
+
+    assert api != same
+    assert api.contentEquals(same)
+    assert hash(api) == hash(same)
+    assert len({api, same}) == 2
+
+    other = api.copy()
+    other.device_model = "opentele"
+    assert not api.contentEquals(other)
+    assert hash(other) == hash(other.contentKey())
+
+    apis = [API.TelegramIOS.Generate(str(x % 100)) for x in range(1000)]
+    unique = APIData.Deduplicate(apis)
+    assert len(unique) == len(set(api.contentKey() for api in apis))
+    assert unique[0] is apis[0]
+
+
+def test_generate_many():
+
+    unique_ids = [f"session{x}" for x in range(200)]
+
+    for api in [
+        API.TelegramAndroid,
+        API.TelegramAndroidX,
+        API.TelegramIOS,
+        API.TelegramMacOS,
+    ]:
+        apis = api.GenerateMany(unique_ids)
+        assert len(apis) == len(unique_ids)
+
+        for unique_id, result in zip(unique_ids, apis):
+            single = api.Generate(unique_id)
+            assert type(result) == api
+            assert result.contentEquals(single)
+            assert APIData.findData(result.pid) is result
+
+        assert len(api.GenerateMany(10)) == 10
+
+    for system in [None, "windows", "macos", "linux"]:
+        apis = API.TelegramDesktop.GenerateMany(unique_ids, system)
+
+        for unique_id, result in zip(unique_ids, apis):
+            single = API.TelegramDesktop.Generate(system, unique_id)
+            assert result.device_model == single.device_model
+            assert result.system_version == single.system_version
+
+    with pytest.raises(NotImplementedError):
+        API.TelegramWeb_K.GenerateMany(unique_ids)
+
+
+def test_generate_fleet():
+
+    apis = API.TelegramIOS.GenerateFleet("fleet", 300)
+    more = API.TelegramIOS.GenerateFleet("fleet", 200, offset=300)
+
+    devices = [(x.device_model, x.system_version) for x in apis + more]
+    assert len(set(devices)) == len(devices)
+    assert all(type(x) == API.TelegramIOS for x in apis)
+
+    again = API.TelegramIOS.GenerateFleet("fleet", 10, offset=295)
+    assert [x.device_model for x in again] == [x[0] for x in devices[295:305]]
+
+    desktop = API.TelegramDesktop.GenerateFleet("fleet", 100, system="linux")
+    assert len({(x.device_model, x.system_version) for x in desktop}) == 100
+
+    with pytest.raises(OpenTeleException):
+        API.TelegramMacOS.GenerateFleet("fleet", 10 ** 6)
+
+
+def test_field_seeds():
+
+    seeds = SystemInfo._seeds("session")
+    assert seeds.hash_id == SystemInfo._strtohashid("session")
+    assert len({seeds[field] for field in FieldSeeds.fields}) == len(FieldSeeds.fields)
+
+    for system in [None, "windows", "macos", "linux"]:
+        first = API.TelegramDesktop.Generate(system, "session")
+        assert first.contentEquals(API.TelegramDesktop.Generate(system, "session"))
+
+    unique_ids = [f"session{x}" for x in range(200)]
+    apis = API.TelegramDesktop.GenerateMany(unique_ids)
+    assert [x.app_version for x in apis] == [
+        API.TelegramDesktop.Generate(unique_id=x).app_version for x in unique_ids
+    ]
+    assert len({x.app_version for x in apis}) > 1
+
+
+def test_random_devices_independent_of_os():
+
+    # the Linux catalog is a multiple of 3, one digest for both would only reach a third of it
+    LinuxDevice.__gen__()
+    positions = {(x.model, x.version): index for index, x in enumerate(LinuxDevice.deviceList)}
+    assert len(positions) % 3 == 0
+
+    for apis in [
+        [API.TelegramDesktop.Generate() for x in range(600)],
+        API.TelegramDesktop.GenerateMany(600),
+    ]:
+        linux = [positions[x.device_model, x.system_version] for x in apis
+                 if (x.device_model, x.system_version) in positions]
+        assert {x % 3 for x in linux} == {0, 1, 2}
+
+
+def test_desktop_filter():
+
+    # macOS models have no year, only Windows and Linux can match
+    filter = DeviceFilter(year=lambda year: year >= 2022)
+    matches = {str(x) for system in [WindowsDevice, LinuxDevice] for x in system.FilteredDevices(filter)}
+    apis = [API.TelegramDesktop.Generate(unique_id=f"session{x}", filter=filter) for x in range(300)]
+    assert all(f"{x.device_model} {x.system_version}" in matches for x in apis)
+    assert {x.system_version.split(" ")[0] for x in apis} == {"Windows", "Linux"}
+
+    api = API.TelegramDesktop.Generate(unique_id="session", filter=filter)
+    assert api.contentEquals(API.TelegramDesktop.Generate(unique_id="session", filter=filter))
+
+    with pytest.raises(ValueError):
+        API.TelegramDesktop.Generate("macos", "session", filter=filter)
+
+def test_app_versions():
+
+    table = AppVersionTable(
+        [AppVersion("3.0", 200), AppVersion("2.1", 190), AppVersion("2.0", 190), AppVersion("1.0")],
+        layer=190,
+    )
+    assert [x.version for x in table.compatible()] == ["2.1", "2.0"]
+    assert [x.version for x in table.compatible(199)] == ["2.1", "2.0"]
+    assert [x.version for x in table.latest(2, 250)] == ["3.0", "2.1"]
+    assert table.pick(5, layer=250) == "2.0"
+    with pytest.raises(ValueError):
+        table.pick(0, layer=100)
+
+    for layer in [216, 221]:
+        apis = API.TelegramDesktop.GenerateMany([f"session{x}" for x in range(200)], layer=layer)
+        versions = {x.version for x in API.TelegramDesktop._appVersions().compatible(layer)}
+        assert {x.app_version[: -len(" x64")] for x in apis} == versions
+
+    assert API.TelegramIOS._appVersions().formatted() == [API.TelegramIOS.app_version]
+    api = API.TelegramAndroid.Generate("session")
+    assert api.app_version == API.TelegramAndroid.app_version
+    assert api.contentEquals(API.TelegramAndroid.GenerateMany(["session"])[0])
+    for layer in [150, 216]:
+        with pytest.raises(ValueError, match="layer can't be used"):
+            API.TelegramAndroid.Generate("session", layer=layer)
+        with pytest.raises(ValueError, match="layer can't be used"):
+            API.TelegramIOS.GenerateMany(["session"], layer=layer)
+
+
+def test_generate_parallel():
+
+    unique_ids = [f"session{x}" for x in range(3000)]
+    for preset, options in [(API.TelegramDesktop, {"system": None}), (API.TelegramAndroid, {})]:
+        serial = preset.GenerateMany(unique_ids, **options)
+        for workers in [1, 2]:
+            apis = preset.GenerateParallel(
+                unique_ids, workers=workers, shard_size=700, **options
+            )
+            assert all(x.contentEquals(y) for x, y in zip(serial, apis))
+            assert len({x.pid for x in apis}) == len(unique_ids)
+
+
+@pytest.mark.asyncio
+async def test_generate_stream():
+
+    unique_ids = [f"session{x}" for x in range(2500)]
+    serial = API.TelegramDesktop.GenerateMany(unique_ids, system="linux")
+
+    chunks = []
+    async for apis in API.TelegramDesktop.GenerateStream(
+        iter(unique_ids), chunk_size=1000, system="linux"
+    ):
+        chunks.append(apis)
+
+    assert [len(x) for x in chunks] == [1000, 1000, 500]
+    assert all(x.contentEquals(y) for x, y in zip(serial, sum(chunks, [])))
+
+    # breaking out of the stream stops it, the remaining IDs are never consumed
+    remaining = iter(unique_ids)
+    async for apis in API.TelegramAndroid.GenerateStream(remaining, chunk_size=100, prefetch=2):
+        break
+    assert len(list(remaining)) == len(unique_ids) - 300
+
+    assert sum([len(x) async for x in API.TelegramIOS.GenerateStream(250, chunk_size=100)]) == 250
@@ -0,0 +1,55 @@
+import sys, pathlib
+
+base_dir = pathlib.Path(__file__).parent.parent.absolute().__str__()
+sys.path.insert(1, base_dir)
+
+from src.__main__ import main
+from src.api import API
+from src import export
+
+
+def test_cli_generate(tmp_path, capsys):
+
+    ids = tmp_path / "ids.txt"
+    ids.write_text("\n".join(f"session{x}" for x in range(500)) + "\n", encoding="utf-8")
+    output = str(tmp_path / "fleet.csv")
+
+    assert main(["generate", "--preset", "TelegramDesktop", "--system", "linux",
+                 "--ids", str(ids), "--output", output, "--chunk-size", "128"]) == 0
+    assert "500 TelegramDesktop APIs" in capsys.readouterr().err
+
+    expected = API.TelegramDesktop.GenerateMany([f"session{x}" for x in range(500)], system="linux")
+    records = list(export.read(output))
+    assert [x for x, _ in records] == [f"session{x}" for x in range(500)]
+    assert all(x.contentEquals(y) for x, (_, y) in zip(expected, records))
+
+    output = str(tmp_path / "samsung.jsonl")
+    assert main(["generate", "--preset", "TelegramAndroid", "--count", "50", "--output", output,
+                 "--filter", "manufacturer=Samsung", "--filter", "sdk=33.."]) == 0
+    assert all(
+        api.device_model.startswith("Samsung") and int(api.system_version[4:]) >= 33
+        for _, api in export.read(output)
+    )
+
+    assert main(["generate", "--preset", "TelegramDesktop", "--count", "30",
+                 "--filter", "year=2022..", "--output", str(tmp_path / "recent.csv")]) == 0
+
+    output = str(tmp_path / "fleet.jsonl")
+    assert main(["generate", "--preset", "TelegramIOS", "--fleet", "key", "--count", "20",
+                 "--output", output, "--chunk-size", "8"]) == 0
+    expected = API.TelegramIOS.GenerateFleet("key", 20)
+    records = list(export.read(output))
+    assert all(x == None for x, _ in records)
+    assert all(x.contentEquals(y) for x, (_, y) in zip(expected, records))
+
+    output = str(tmp_path / "workers.jsonl")
+    assert main(["generate", "--preset", "TelegramDesktop", "--ids", str(ids), "--output", output,
+                 "--chunk-size", "200", "--workers", "2"]) == 0
+    expected = API.TelegramDesktop.GenerateMany([f"session{x}" for x in range(500)])
+    assert all(x.contentEquals(y) for x, (_, y) in zip(expected, export.read(output)))
+
+    assert main(["generate", "--preset", "TelegramIOS", "--system", "linux", "--count", "1"]) == 2
+    assert main(["generate", "--preset", "TelegramIOS", "--ids", str(tmp_path / "missing.txt"),
+                 "--output", str(tmp_path / "missing.jsonl")]) == 2
+    assert "missing.txt" in capsys.readouterr().err
+    assert main(["generate", "--preset", "TelegramIOS", "--fleet", "key", "--count", "10000000"]) == 2
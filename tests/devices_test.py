@@ -0,0 +1,459 @@
+import os, sys, pathlib
+import subprocess
+import pytest
+
+base_dir = pathlib.Path(__file__).parent.parent.absolute().__str__()
+sys.path.insert(1, base_dir)
+
+from src import bulk
+from src.devices import *
+
+
+def test_linux_device_list():
+
+    LinuxDevice.__gen__()
+    deviceList = LinuxDevice.deviceList
+    models = list(LinuxDevice.device_models)
+
+    assert len(deviceList) == len(LinuxDevice.system_versions) * len(models)
+
+    index = 0
+    for version in LinuxDevice.system_versions:
+        for model in models:
+            device = deviceList[index]
+            assert device.model == model and device.version == version
+            index += 1
+
+    assert deviceList[-1].version == deviceList[len(deviceList) - 1].version
+    assert [str(x) for x in deviceList[5:8]] == [str(deviceList[x]) for x in range(5, 8)]
+
+    with pytest.raises(IndexError):
+        deviceList[len(deviceList)]
+
+    assert str(LinuxDevice.RandomDevice("opentele")) == str(LinuxDevice.RandomDevice("opentele"))
+
+
+def test_device_space():
+
+    space = DeviceSpace(
+        [
+            ProductSequence([["a", "b"], ["1", "2", "3"]], DeviceInfo),
+            ProductSequence([["c"], ["4", "5"]], DeviceInfo),
+        ]
+    )
+    expected = ["a 1", "a 2", "a 3", "b 1", "b 2", "b 3", "c 4", "c 5"]
+
+    assert len(space) == len(expected)
+    assert [str(x) for x in space] == expected
+    assert [str(x) for x in space[::-1]] == expected[::-1]
+    assert str(space[-2]) == "c 4"
+    pairs = ProductSequence([["a", "b"], ["1", "2"]], lambda *x: x)
+    assert pairs.count(("b", "1")) == 1 and pairs.index(("b", "1")) == pairs.flatIndex([1, 0]) == 2
+    assert space.count(None) == 0
+
+    iOSDeivce.__gen__()
+    for index, device in enumerate(iOSDeivce.deviceList):
+        major = int(device.version.split(".")[0])
+        assert device.model.startswith("iPhone ")
+        assert major in iOSDeivce.system_versions
+
+    for system in [WindowsDevice, LinuxDevice, macOSDevice, AndroidDevice, iOSDeivce]:
+        system.__gen__()
+        assert isinstance(system.deviceList, DeviceSpace)
+        assert len(system.RandomDevices(["opentele"] * 3)) == 3
+
+    device = LinuxDevice.deviceList[0]
+    assert not hasattr(device, "__dict__")
+    assert device.version is LinuxDevice.deviceList[1].version
+
+
+def test_hash_id_cache():
+
+    cache = SystemInfo.hashIdCache
+    cache.resize(4)
+
+    first = SystemInfo._strtohashid("opentele")
+    assert SystemInfo._strtohashid("opentele") == first
+    assert cache.info().hits == 1 and cache.info().misses == 1
+
+    SystemInfo._strtohashids(["a", "b", "c", "d", None, 1234])
+    assert cache.info().currsize == 4
+    assert SystemInfo._strtohashid(1234) == SystemInfo._strtohashid("1234")
+
+    # random ids are never cached
+    SystemInfo._strtohashid()
+    assert cache.info().currsize == 4
+
+    cache.clear()
+    assert SystemInfo._strtohashid("opentele") == first
+    assert cache.info().misses == 1
+
+    cache.resize(8192)
+
+
+def test_concurrent_cold_start():
+
+    # needs a fresh interpreter, the catalogs of this one are already built
+    script = """
+import sys, threading
+sys.path.insert(1, sys.argv[1])
+sys.setswitchinterval(1e-6)
+
+from src import devices
+from src.devices import *
+
+built = []
+init = DeviceSpace.__init__
+
+def counted(self, *args, **kwargs):
+    built.append(self)
+    init(self, *args, **kwargs)
+
+DeviceSpace.__init__ = counted
+
+systems = [WindowsDevice, LinuxDevice, macOSDevice, AndroidDevice, iOSDeivce]
+barrier = threading.Barrier(32)
+results = {}
+errors = []
+
+def hammer(index):
+    try:
+        barrier.wait()
+        results[index] = [
+            str(system.RandomDevice(f"opentele{x}")) for x in range(50) for system in systems
+        ]
+    except BaseException as e:
+        errors.append(e)
+
+threads = [threading.Thread(target=hammer, args=(x,)) for x in range(32)]
+[thread.start() for thread in threads]
+[thread.join() for thread in threads]
+
+assert not errors, errors
+assert len(built) == len(systems), len(built)
+assert all(result == results[0] for result in results.values())
+assert len(set(macOSDevice.device_models)) == len(macOSDevice.device_models)
+"""
+    for x in range(3):
+        subprocess.run([sys.executable, "-c", script, base_dir], check=True)
+
+
+def test_preload():
+
+    script = """
+import sys, gc
+sys.path.insert(1, sys.argv[1])
+
+import src
+from src.devices import *
+
+src.preload(["android", "linux"], freeze=False)
+assert len(AndroidDevice.deviceList) and len(LinuxDevice.deviceList)
+assert not len(WindowsDevice.deviceList) and not len(iOSDeivce.deviceList)
+assert gc.get_freeze_count() == 0
+
+src.preload()
+assert all(len(system.deviceList) for system in platforms.values())
+assert gc.get_freeze_count() > 0
+
+try:
+    src.preload(["beos"])
+except BaseException as e:
+    assert "beos" in str(e)
+else:
+    assert False
+"""
+    subprocess.run([sys.executable, "-c", script, base_dir], check=True)
+
+
+def test_compiled_catalog(tmp_path):
+
+    from src import catalog
+
+    path = catalog.compile(tmp_path / "catalog.bin")
+    mapped = catalog.MappedCatalog(path)
+
+    for name, system in platforms.items():
+        system.__gen__()
+        assert name in mapped
+
+        segments = mapped.dimensions(name)
+        assert len(segments) == len(system.deviceList.segments)
+
+        for (build, dimensions), segment in zip(segments, system.deviceList.segments):
+            assert DeviceSpace.builds[build] is segment.build
+            assert [list(x) for x in dimensions] == [list(x) for x in segment.dimensions]
+
+    desktop = list(mapped.desktopModels())
+    assert [x[0] for x in desktop] == list(GeneralDesktopDevice.device_models)
+    key, manufacturer, model, year, type = desktop[0]
+    assert GeneralDesktopDevice.device_models[key] == {
+        "manufacturer": manufacturer,
+        "model": model,
+        "year": year,
+        "type": type,
+    }
+    keys = mapped.strings("desktop/keys")
+    assert keys.count(key) == 1 and keys.index(key) == 0
+    mapped.close()
+
+    (tmp_path / "broken.bin").write_bytes(b"opentele")
+    assert catalog.load(tmp_path / "broken.bin") == None
+    assert catalog.load(tmp_path / "missing.bin") == None
+
+    script = """
+import sys
+sys.path.insert(1, sys.argv[1])
+
+from src import catalog
+catalog.DEFAULT_PATH = sys.argv[2]
+
+from src.devices import *
+
+for system in platforms.values():
+    system.__gen__()
+    assert isinstance(system.deviceList.segments[0].dimensions[0], catalog.MappedStrings)
+
+print(*[system.RandomDevice("opentele") for system in platforms.values()], sep="|")
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script, base_dir, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    expected = [str(system.RandomDevice("opentele")) for system in platforms.values()]
+    assert result.stdout.strip().split("|") == expected
+
+
+def test_import_time():
+
+    # budget of `import src`, relative to `import asyncio` timed in the same process,
+    # so that it doesn't depend on the speed or the load of the machine
+    budget = float(os.environ.get("OPENTELE_IMPORT_BUDGET", 2.5))
+
+    script = """
+import sys
+sys.path.insert(1, sys.argv[1])
+
+import src
+print(*sorted(x for x in sys.modules if x.startswith("src.")), sep="|")
+print(*sorted(x for x in ["asyncio", "concurrent.futures", "numpy"] if x in sys.modules), sep="|")
+
+import asyncio
+
+from src.devices import AndroidDevice
+AndroidDevice.device_models
+print(*sorted(x for x in sys.modules if x.startswith("src.devices_")), sep="|")
+"""
+    ratios = []
+    for x in range(5):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script, base_dir],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        modules, dependencies, loaded = result.stdout.split("\n")[:3]
+
+        # the catalog literals are only imported when their platform is used
+        assert not any(x.startswith("src.devices_") for x in modules.split("|"))
+        assert loaded == "src.devices_android"
+
+        # and the modules of the bulk, parallel and streaming APIs when they're called
+        lazy = ["src.app_versions", "src.bulk", "src.catalog", "src.parallel", "src.streaming", "src.warmup"]
+        assert not any(x in modules.split("|") for x in lazy)
+        assert dependencies == ""
+
+        # import time: self [us] | cumulative | imported package
+        timings = {}
+        for line in result.stderr.splitlines()[1:]:
+            _, cumulative, name = line.split("|")
+            timings[name.strip()] = int(cumulative)
+        ratios.append(timings["src"] / timings["asyncio"])
+
+    assert min(ratios) < budget, f"import src took {min(ratios):.2f} times import asyncio"
+
+
+def test_device_permutation():
+
+    for system in [WindowsDevice, macOSDevice, AndroidDevice, iOSDeivce]:
+        fleet = system.Permutation("fleet")
+        indices = [fleet.catalogIndex(x) for x in range(len(fleet))]
+
+        assert sorted(indices) == list(range(len(system.deviceList)))
+        assert all(fleet.position(index) == x for x, index in enumerate(indices))
+        assert str(fleet[3]) == str(system.deviceList[indices[3]])
+
+        assert indices == [system.Permutation("fleet").catalogIndex(x) for x in range(len(fleet))]
+        assert indices != [system.Permutation("other").catalogIndex(x) for x in range(len(fleet))]
+
+    with pytest.raises(IndexError):
+        fleet.catalogIndex(len(fleet))
+
+    for count in range(6):
+        assert sorted(DevicePermutation(list(range(count)), "k")[:]) == list(range(count))
+
+    permutation = DevicePermutation(list(range(10)), "k")
+    assert permutation.index(permutation[3]) == 3 and permutation.count(permutation[3]) == 1
+
+
+def test_weighted_device():
+
+    table = AliasTable([1, 0, 3, 4])
+    chances = [0] * table.count
+    for column in range(table.count):
+        chances[column] += table.probability[column]
+        chances[table.alias[column]] += table.resolution - table.probability[column]
+    assert chances == [x * table.resolution // 2 for x in [1, 0, 3, 4]]
+
+    with pytest.raises(ValueError):
+        AliasTable([0, 0])
+
+    models = GeneralDesktopDevice.device_models
+    keys = {key for key, info in models.items() if info["type"] == "laptop"}
+    weights = DeviceWeights(half_life=2, type={"motherboard": 0, "desktop": 0})
+
+    for system in [WindowsDevice, LinuxDevice]:
+        system.__gen__()
+        devices = [system.RandomDevice(f"session{x}", weights=weights) for x in range(500)]
+
+        assert all(device.version in system.system_versions for device in devices)
+        assert str(devices[7]) == str(system.RandomDevice("session7", weights=weights))
+        assert len({device.model for device in devices}) > 10
+
+        if system is LinuxDevice:
+            assert all(device.model in keys for device in devices)
+
+    with pytest.raises(NotImplementedError):
+        AndroidDevice.RandomDevice("session", weights=weights)
+
+
+def test_weighted_device_speed(tmp_path):
+
+    from src import catalog
+
+    path = catalog.compile(tmp_path / "catalog.bin")
+
+    # a weighted draw is an alias table lookup, as cheap as a uniform one once the table is built
+    script = """
+import sys, time
+sys.path.insert(1, sys.argv[1])
+
+from src import catalog
+catalog.DEFAULT_PATH = sys.argv[2]
+
+from src.devices import *
+
+assert catalog.load() != None
+weights = DeviceWeights(half_life=2)
+seeds = SystemInfo._seedsMany(f"session{x}" for x in range(2000))
+WindowsDevice._WeightedDevice(seeds[0], weights)
+
+def timed(draw):
+    begin = time.perf_counter()
+    for seed in seeds:
+        draw(seed)
+    return time.perf_counter() - begin
+
+uniform = min(timed(lambda x: WindowsDevice._SeededDevice(x)) for _ in range(3))
+weighted = min(timed(lambda x: WindowsDevice._WeightedDevice(x, weights)) for _ in range(3))
+print(weighted / uniform)
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script, base_dir, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert float(result.stdout) < 10
+
+
+def test_filtered_device():
+
+    models = GeneralDesktopDevice.device_models
+    recent = {key for key, info in models.items() if info["year"] >= 2023}
+
+    cases = [
+        (AndroidDevice, DeviceFilter(manufacturer="Samsung", sdk=lambda sdk: sdk >= 34),
+         lambda x: x.model.startswith("Samsung ") and int(x.version[4:]) >= 34),
+        (iOSDeivce, DeviceFilter(major=[17, 18], model=lambda model: "Pro" in model),
+         lambda x: x.version.split(".")[0] in ["17", "18"] and "Pro" in x.model),
+        (LinuxDevice, DeviceFilter(year=lambda year: year >= 2023, version=lambda v: "X11" in v),
+         lambda x: x.model in recent and "X11" in x.version),
+    ]
+
+    for system, filter, expected in cases:
+        system.__gen__()
+        matches = system.FilteredDevices(filter)
+        assert [str(x) for x in matches] == [str(x) for x in system.deviceList if expected(x)]
+        assert system.FilteredDevices(filter) is matches
+
+        device = system.RandomDevice("session", filter=filter)
+        assert expected(device)
+        assert str(device) == str(system.RandomDevice("session", filter=filter))
+
+    laptops = DeviceFilter(type="laptop", version="Windows 11")
+    assert all(x.version == "Windows 11" for x in WindowsDevice.FilteredDevices(laptops))
+
+    with pytest.raises(ValueError):
+        AndroidDevice.FilteredDevices(DeviceFilter(year=2022))
+
+    with pytest.raises(ValueError):
+        AndroidDevice.FilteredDevices(DeviceFilter(sdk=0))
+
+    with pytest.raises(NotImplementedError):
+        macOSDevice.RandomDevice("session", weights=DeviceWeights(half_life=2))
+
+
+def test_stable_device():
+
+    AndroidDevice.__gen__()
+    models = list(AndroidDevice.device_models)
+    versions = list(AndroidDevice.system_versions)
+
+    old = DeviceSpace.Product(models[:-25] + models[-20:], versions[:-1])
+    new = DeviceSpace.Product(models, versions)
+    seeds = SystemInfo._seedsMany(f"session{x}" for x in range(4000))
+
+    moved = sum(
+        str(old.stable(x["model"], x["system_version"]))
+        != str(new.stable(x["model"], x["system_version"]))
+        for x in seeds
+    ) / len(seeds)
+    ideal = 1 - len(old) / len(new)
+    assert abs(moved - ideal) < 0.05
+    assert moved < 0.5 * sum(
+        str(old[x.hash_id % len(old)]) != str(new[x.hash_id % len(new)]) for x in seeds
+    ) / len(seeds)
+
+    device = AndroidDevice.RandomDevice("session", stable=True)
+    assert str(device) == str(AndroidDevice.RandomDevice("session", stable=True))
+
+    filter = DeviceFilter(major=17)
+    assert all(
+        iOSDeivce.RandomDevice(f"session{x}", filter=filter, stable=True).version.startswith("17.")
+        for x in range(100)
+    )
+
+    with pytest.raises(ValueError):
+        WindowsDevice.RandomDevice("session", weights=DeviceWeights(), stable=True)
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_device_indices(monkeypatch, vectorized):
+
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bulk, "_numpy", None)
+
+    unique_ids = [f"session{x}" for x in range(5000)] + [123, "сессия"]
+    hash_ids = SystemInfo._strtohashids(unique_ids)
+    assert list(bulk.hashIds(unique_ids)) == hash_ids
+
+    devices = AndroidDevice.DeviceIndices(unique_ids)
+    assert len(devices) == len(unique_ids)
+    assert [str(x) for x in devices] == [str(x) for x in AndroidDevice._RandomDevices(hash_ids)]
+    assert str(devices[10:20][0]) == str(devices[10])
+    assert len(AndroidDevice.DeviceIndices([None, None])) == 2
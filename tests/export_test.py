@@ -0,0 +1,65 @@
+import sys, pathlib
+import io
+import pytest
+
+base_dir = pathlib.Path(__file__).parent.parent.absolute().__str__()
+sys.path.insert(1, base_dir)
+
+from src.api import API
+from src import export
+
+
+@pytest.mark.parametrize("format", ["jsonl", "csv", "bin"])
+def test_export_roundtrip(tmp_path, format):
+
+    unique_ids = [f"session{x}" for x in range(300)] + ["сессия", None]
+    apis = API.TelegramDesktop.GenerateMany(unique_ids) + [API.TelegramWeb_K(), API.TelegramWeb_Z()]
+    unique_ids += [None, "empty"]
+
+    path = str(tmp_path / f"fleet.{format}")
+    with export.writer(path) as output:
+        output.writeMany(apis, unique_ids)
+    assert output.count == len(apis)
+
+    records = list(export.read(path))
+    assert [x for x, _ in records] == unique_ids
+    assert all(x.contentEquals(y) for x, (_, y) in zip(apis, records))
+
+    # an empty string isn't replaced by the default of the class
+    assert records[-1][1].lang_pack == ""
+
+
+def test_export_binary():
+
+    apis = API.TelegramAndroid.GenerateMany([f"session{x}" for x in range(100)])
+    file = io.BytesIO()
+    with export.BinaryWriter(file) as output:
+        output.writeMany(apis, range(100))
+
+    file.seek(0)
+    fleet = export.BinaryReader(file)
+    assert len(fleet) == 100
+    unique_id, api = fleet[-3]
+    assert unique_id == "97" and api.contentEquals(apis[97])
+
+    with pytest.raises(ValueError):
+        export.BinaryWriter(io.BytesIO(), {"device_model": 8}).write(apis[0])
+    with pytest.raises(ValueError):
+        export.BinaryReader(io.BytesIO(b"not an export"))
+    with pytest.raises(ValueError):
+        export.formatOf("fleet.xml")
+
+
+@pytest.mark.parametrize("format", ["jsonl", "csv", "bin"])
+def test_export_pathlike(tmp_path, format):
+
+    apis = API.TelegramIOS.GenerateMany(["first", "second"])
+    path = tmp_path / f"fleet.{format}"
+
+    with export.writer(path) as output:
+        output.writeMany(apis, ["first", "second"])
+    assert path.exists()
+
+    records = list(export.read(path))
+    assert [x for x, _ in records] == ["first", "second"]
+    assert all(x.contentEquals(y) for x, (_, y) in zip(apis, records))
@@ -0,0 +1,260 @@
+"""
+Golden corpus of unique_id -> device mappings.
+
+`Generate(unique_id=...)` has to return the same device forever, sessions depend on it. The
+corpus records the mapping of `COUNT` unique IDs for every preset and desktop OS, so changes
+to the hashing, the catalogs or their order can be verified not to remap a single one.
+The `app_version` of every preset is recorded too, in the `Preset:app_version` cases.
+
+Only digests are stored: the IDs are split into blocks of `BLOCK`, and each block keeps the
+sha1 of its results plus the full result of its first ID, which makes a failure readable.
+The unique IDs themselves are derived from their index, see `uniqueIds()`.
+
+    python -m tests.golden.corpus                       check the current tree
+    python -m tests.golden.corpus --write --source DIR  record the mappings of another checkout
+    python -m tests.golden.corpus --write --case NAME   record only NAME, keep the other cases
+
+`--write` goes through the public `Generate()` one ID at a time. `check()` goes through the
+vectorized lookups of `bulk` and `_indicesMany()`, and through `Generate()` for the sampled IDs.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import typing
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mappings.json")
+FORMAT_VERSION = 1
+
+COUNT = 200_000
+BLOCK = 4096
+
+DESKTOP_SYSTEMS = ["windows", "macos", "linux"]
+
+CASES = [
+    "hash_id",
+    "TelegramDesktop",
+    "TelegramDesktop/windows",
+    "TelegramDesktop/macos",
+    "TelegramDesktop/linux",
+    "TelegramAndroid",
+    "TelegramAndroidX",
+    "TelegramIOS",
+    "TelegramMacOS",
+    "TelegramDesktop:app_version",
+    "TelegramAndroid:app_version",
+    "TelegramAndroidX:app_version",
+    "TelegramIOS:app_version",
+    "TelegramMacOS:app_version",
+]
+
+
+def uniqueIds(count: int = COUNT) -> typing.List[str]:
+    """
+    The unique IDs of the corpus, shaped like what people actually pass in:
+    user ids, session file names, hex strings and non-ascii names.
+    """
+    results = []
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            results.append(str(index * 7919 + 100_000_000))
+        elif kind == 1:
+            results.append(f"{index}.session")
+        elif kind == 2:
+            results.append(f"tdata_{index:08x}")
+        else:
+            results.append(f"сессия-{index}")
+    return results
+
+
+def encode(result: typing.Union[int, typing.Tuple[str, str]]) -> str:
+    return str(result) if isinstance(result, int) else "\x1f".join(result)
+
+
+def blockDigest(results: typing.Iterable[str]) -> str:
+    return hashlib.sha1("\n".join(results).encode("utf-8")).hexdigest()[:16]
+
+
+def summarize(ids: typing.List[str], results: typing.List[str]) -> dict:
+    blocks = []
+    samples = []
+    for begin in range(0, len(ids), BLOCK):
+        blocks.append(blockDigest(results[begin : begin + BLOCK]))
+        samples.append([ids[begin], results[begin]])
+    return {"blocks": blocks, "samples": samples}
+
+
+def splitCase(case: str) -> typing.Tuple[str, typing.Optional[str], str]:
+    # "Preset/system:field", the field is the device by default
+    case, _, field = case.partition(":")
+    preset, _, system = case.partition("/")
+    return preset, system or None, field or "device"
+
+
+def generate(case: str, unique_id: str) -> str:
+    """
+    Result of a single unique ID, through the public API.
+    """
+    from src.api import API
+    from src.devices import SystemInfo
+
+    if case == "hash_id":
+        return encode(SystemInfo._strtohashid(unique_id))
+
+    preset, system, field = splitCase(case)
+    cls = getattr(API, preset)
+    api = cls.Generate(system, unique_id) if preset == "TelegramDesktop" else cls.Generate(unique_id)
+    result = api.app_version if field == "app_version" else encode((api.device_model, api.system_version))
+    api.destroy()
+    return result
+
+
+def bulkResults(case: str, ids: typing.List[str], hash_ids) -> typing.List[str]:
+    """
+    Results of all unique IDs at once, through the vectorized lookups.
+
+    ### Arguments:
+        hash_ids (`numpy.ndarray` | `array.array`):
+            The hash ids of `ids`, from `bulk.hashIds()`.
+    """
+    from src import bulk
+    from src.api import API
+    from src.devices import DeviceIndices, SystemInfo, platforms
+
+    if case == "hash_id":
+        return [str(x) for x in hash_ids.tolist()]
+
+    preset, system, field = splitCase(case)
+    cls = getattr(API, preset)
+
+    if field == "app_version":
+        # the app version indices that GenerateMany() uses
+        _, _, versions = cls._indicesMany(SystemInfo._seedsMany(ids))
+        formatted = cls._appVersions().formatted()
+        return [formatted[x] for x in versions]
+
+    if preset != "TelegramDesktop" or system != None:
+        systemInfo = cls._systemInfo() if system == None else platforms[system]
+        systemInfo.__gen__()
+        deviceList = systemInfo.deviceList
+        devices = DeviceIndices(deviceList, bulk.indices(hash_ids, len(deviceList)))
+        return [encode((x.model, x.version)) for x in devices]
+
+    # the OS, then the device in the catalog of that OS, both by hash id
+    deviceLists = []
+    for name in DESKTOP_SYSTEMS:
+        platforms[name].__gen__()
+        deviceLists.append(platforms[name].deviceList)
+
+    systems = bulk.indices(hash_ids, len(DESKTOP_SYSTEMS)).tolist()
+    indices = [bulk.indices(hash_ids, len(x)).tolist() for x in deviceLists]
+
+    results = []
+    for position, system in enumerate(systems):
+        device = deviceLists[system][indices[system][position]]
+        results.append(encode((device.model, device.version)))
+    return results
+
+
+def write(path: str = CORPUS_PATH, count: int = COUNT, cases: typing.List[str] = None) -> None:
+    """
+    Record the corpus of the tree on `sys.path`.
+
+    ### Arguments:
+        cases (`List[str]`, default=`None`):
+            Only record these cases, and keep the others of the corpus at `path`.\\
+            Default is `None` - which records a new corpus with every case of `CASES`.
+    """
+    ids = uniqueIds(count)
+    corpus = {"format": FORMAT_VERSION, "count": count, "block": BLOCK, "cases": {}}
+    if cases != None:
+        with open(path, encoding="utf-8") as file:
+            corpus = json.load(file)
+        assert corpus["count"] == count and corpus["block"] == BLOCK
+
+    for case in CASES if cases == None else cases:
+        begin = time.perf_counter()
+        corpus["cases"][case] = summarize(ids, [generate(case, x) for x in ids])
+        print(f"{case:<26}{time.perf_counter() - begin:8.2f} s")
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(corpus, file, indent=1, ensure_ascii=False)
+        file.write("\n")
+
+
+def check(path: str = CORPUS_PATH, blocks: int = None) -> typing.List[str]:
+    """
+    Verify the current tree against the corpus.
+
+    ### Arguments:
+        blocks (`int`, default=`None`):
+            Only check the first `blocks` blocks of every case, default is all of them.
+
+    ### Returns:
+        `List[str]`: A description of every mismatch, empty if the tree matches the corpus.
+    """
+    from src import bulk
+
+    with open(path, encoding="utf-8") as file:
+        corpus = json.load(file)
+
+    assert corpus["format"] == FORMAT_VERSION and corpus["block"] == BLOCK
+
+    count = corpus["count"] if blocks == None else min(corpus["count"], blocks * BLOCK)
+    ids = uniqueIds(count)
+    hash_ids = bulk.hashIds(ids)
+
+    failures = []
+    for case, expected in corpus["cases"].items():
+        actual = summarize(ids, bulkResults(case, ids, hash_ids))
+
+        for index, (digest, (unique_id, sample)) in enumerate(
+            zip(expected["blocks"], expected["samples"])
+        ):
+            if index == len(actual["blocks"]):
+                break
+
+            public = generate(case, unique_id)
+            if public != sample:
+                failures.append(f"{case}: Generate({unique_id!r}) gives {public!r}, expected {sample!r}")
+
+            if actual["blocks"][index] != digest:
+                begin = index * BLOCK
+                failures.append(
+                    f"{case}: unique IDs {begin}..{begin + BLOCK - 1} are mapped differently"
+                    f" (first one gives {actual['samples'][index][1]!r}, expected {sample!r})"
+                )
+
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--write", action="store_true", help="record the corpus instead of checking it")
+    parser.add_argument("--source", help="import opentele from this checkout instead")
+    parser.add_argument("--path", default=CORPUS_PATH, help="corpus file")
+    parser.add_argument("--count", type=int, default=COUNT, help="unique IDs to record")
+    parser.add_argument("--case", action="append", choices=CASES, help="only record this case, can be repeated")
+    parser.add_argument("--blocks", type=int, help="only check the first N blocks")
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.abspath(args.source) if args.source else os.getcwd())
+
+    if args.write:
+        write(args.path, args.count, args.case)
+        return 0
+
+    begin = time.perf_counter()
+    failures = check(args.path, args.blocks)
+    for failure in failures:
+        print(failure)
+
+    print(f"{len(failures)} mismatches, checked in {time.perf_counter() - begin:.2f} s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import os, sys, pathlib
+import json
+
+base_dir = pathlib.Path(__file__).parent.parent.absolute().__str__()
+sys.path.insert(1, base_dir)
+
+from tests.golden import corpus
+
+
+def test_golden_mappings():
+    # OPENTELE_GOLDEN_BLOCKS=N only checks the first N blocks of every case
+    blocks = os.environ.get("OPENTELE_GOLDEN_BLOCKS")
+    failures = corpus.check(blocks=int(blocks) if blocks else None)
+    assert failures == [], "\n".join(failures[:20])
+
+
+def test_golden_detects_remap(tmp_path):
+
+    with open(corpus.CORPUS_PATH, encoding="utf-8") as file:
+        golden = json.load(file)
+
+    golden["cases"]["TelegramAndroid"]["blocks"][1] = "0" * 16
+    golden["cases"]["TelegramIOS"]["samples"][0][1] = "iPhone 1\x1f1.0"
+    golden["cases"]["TelegramDesktop:app_version"]["blocks"][0] = "0" * 16
+
+    path = str(tmp_path / "mappings.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(golden, file)
+
+    failures = corpus.check(path, blocks=2)
+    assert len(failures) == 3
+    assert failures[0].startswith("TelegramAndroid: unique IDs 4096..8191")
+    assert failures[1].startswith("TelegramIOS: Generate('100000000') gives")
+    assert failures[2].startswith("TelegramDesktop:app_version: unique IDs 0..4095")
+
+
+def test_golden_without_numpy(monkeypatch):
+
+    from src import bulk
+
+    monkeypatch.setattr(bulk, "_numpy", None)
+    assert corpus.check(blocks=1) == []